@@ -1,60 +1,64 @@
+import atexit
+import codecs
+import functools
 import os
+import queue
 import sys
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from platform import system
 import time
 from datetime import datetime
 
-from PyQt6.QtCore import QTimer, pyqtSlot, Qt
-from PyQt6.QtGui import QAction, QIcon
+from PyQt6.QtCore import (QFileSystemWatcher, QObject, QProcess, QRunnable,
+                          QThread, QThreadPool, QTimer, pyqtSignal, pyqtSlot,
+                          Qt)
+from PyQt6.QtGui import QAction, QIcon, QTextCursor
 from PyQt6.QtWidgets import (QApplication, QCheckBox, QDialog, QFileDialog,
                              QFormLayout, QLabel, QLineEdit, QMenu,
-                             QMessageBox, QPushButton, QSystemTrayIcon,
-                             QTextEdit, QVBoxLayout, QWidget)
+                             QMessageBox, QPushButton, QSizePolicy,
+                             QSystemTrayIcon, QTextEdit, QToolButton,
+                             QVBoxLayout, QWidget)
 
-# Import using absolute paths for PyInstaller compatibility
+# The ducktrack submodules pull in OBS, pynput and friends, so they are imported
+# lazily where they are used. They are imported by absolute path for PyInstaller compatibility.
 if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
     # Running in a PyInstaller bundle
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from ducktrack.obs_client import close_obs, is_obs_running, open_obs
-    from ducktrack.playback import Player, get_latest_recording
-    from ducktrack.recorder import Recorder
-    from ducktrack.util import get_recordings_dir, open_file
-else:
-    # Running in a normal Python environment
-    from .obs_client import close_obs, is_obs_running, open_obs
-    from .playback import Player, get_latest_recording
-    from .recorder import Recorder
-    from .util import get_recordings_dir, open_file
 
 # Set up logging to file
-log_file = os.path.expanduser("~/ducktrack.log")
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    filename=log_file,
-    filemode='a'
-)
+LOG_FILE = os.path.expanduser("~/ducktrack.log")
+PERMISSIONS_SENTINEL = os.path.expanduser("~/.ducktrack_perm_ok")
+file_handler = logging.FileHandler(LOG_FILE, mode='a')
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 
 # Also log to stderr
 console = logging.StreamHandler()
-console.setLevel(logging.DEBUG)
+console.setLevel(logging.WARNING)
 formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 console.setFormatter(formatter)
-logging.getLogger('').addHandler(console)
 
-logger = logging.getLogger('DuckTrack')
+# Loggers only enqueue records, a background listener thread does the actual writes
+log_queue = queue.Queue(-1)
+root_logger = logging.getLogger('')
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(QueueHandler(log_queue))
+
+# DUCKTRACK_DEBUG=1 brings back full debug output in both the file and the console
+if os.environ.get("DUCKTRACK_DEBUG"):
+    root_logger.setLevel(logging.DEBUG)
+    console.setLevel(logging.DEBUG)
 
-# Redirect print statements to logger
-original_print = print
-def print_to_log(*args, **kwargs):
-    message = ' '.join(str(arg) for arg in args)
-    logger.info(message)
-    original_print(*args, **kwargs)
-print = print_to_log
+log_listener = QueueListener(log_queue, file_handler, console, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+logger = logging.getLogger('DuckTrack')
 
 logger.info("----- DuckTrack Starting -----")
 
+_IS_DARWIN = system() == "Darwin"
+
 class TitleDescriptionDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -68,7 +72,8 @@ class TitleDescriptionDialog(QDialog):
 
         self.title_label = QLabel("Title:")
         self.title_input = QLineEdit(self)
-        self.title_input.setText(f"Recording-{datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}")  # Default title
+        self._default_title = f"Recording-{datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}"
+        self.title_input.setText(self._default_title)  # Default title
         self.form_layout.addRow(self.title_label, self.title_input)
 
         self.description_label = QLabel("Description:")
@@ -84,22 +89,120 @@ class TitleDescriptionDialog(QDialog):
         layout.addWidget(self.submit_button)
 
     def get_values(self):
-        return self.title_input.text(), self.description_input.toPlainText()
+        # Use default title if empty
+        return (self.title_input.text() or self._default_title), self.description_input.toPlainText()
+
+class LogReader(QThread):
+    """
+    Reads the log file in chunks off the GUI thread.
+    Starts from the tail of the file unless given an offset to resume from.
+    """
+
+    chunk_read = pyqtSignal(str)
+
+    CHUNK_SIZE = 65536
+    TAIL_SIZE = 262144
+
+    def __init__(self, path: str, offset: int | None = None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.offset = offset
+
+    def run(self):
+        try:
+            with open(self.path, 'rb') as f:
+                size = f.seek(0, os.SEEK_END)
+                
+                if self.offset is None or self.offset > size:
+                    # first load (or the log was truncated), only show the tail
+                    f.seek(max(0, size - self.TAIL_SIZE))
+                    if f.tell() > 0:
+                        f.readline()  # skip the partial first line
+                else:
+                    f.seek(self.offset)
+                
+                # chunk boundaries can split multi-byte characters
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                while not self.isInterruptionRequested():
+                    chunk = f.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    self.chunk_read.emit(decoder.decode(chunk))
+                
+                # leave any incomplete trailing character for the next read
+                self.offset = f.tell() - len(decoder.getstate()[0])
+        except Exception as e:
+            self.chunk_read.emit(f"Error loading log file: {str(e)}")
+
+class _FinalizeSignals(QObject):
+    finalize_done = pyqtSignal()
+
+class _FinalizeTask(QRunnable):
+    """
+    Renames a finished recording and writes its README off the GUI thread.
+    """
+    
+    def __init__(self, recording_dir: str, renamed_dir: str | None, readme_text: str):
+        super().__init__()
+        self.recording_dir = recording_dir
+        self.renamed_dir = renamed_dir
+        self.readme_text = readme_text
+        self.signals = _FinalizeSignals()
+
+    def run(self):
+        recording_dir = self.recording_dir
+        
+        # Rename the directory with the title
+        if self.renamed_dir is not None:
+            try:
+                os.rename(self.recording_dir, self.renamed_dir)
+                recording_dir = self.renamed_dir
+                logger.info(f"Renamed recording directory to {self.renamed_dir}")
+            except Exception as e:
+                logger.error(f"Error renaming directory: {e}")
+        
+        readme_path = os.path.join(recording_dir, 'README.md')
+        try:
+            # the README is tiny, a single raw write skips the text-mode buffering layers
+            fd = os.open(readme_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, self.readme_text.encode("utf-8"))
+            finally:
+                os.close(fd)
+            logger.info(f"Saved README to {readme_path}")
+        except Exception as e:
+            logger.error(f"Error writing README: {e}")
+        
+        self.signals.finalize_done.emit()
 
 class MainInterface(QWidget):
+    # counted from launching OBS, about as long as the old sleeps and connect retries took together
+    OBS_READY_TIMEOUT = 10.0
+    OBS_POLL_INTERVAL_MS = 100
+
     def __init__(self, app: QApplication):
         super().__init__()
-        self.tray = QSystemTrayIcon(QIcon(resource_path("assets/duck.png")))
+        self.tray = QSystemTrayIcon(get_duck_icon())
         self.tray.show()
                 
         self.app = app
         self.obs_process = None
+        self.recorder_thread = None
+        self.last_played_recording_path = None
+        self._recording_state = "idle"
+        self._player = None
+        self._waiting_for_obs = False
+        self._pending_on_ready = None
+        self._cleaned_up = False
+        
+        # Every exit path (Quit, closing the window, Cmd-Q on macOS) goes through aboutToQuit
+        app.aboutToQuit.connect(self._cleanup)
         
         self.init_tray()
         self.init_window()
         
         # Check if on macOS and ensure permissions
-        if system() == "Darwin":
+        if _IS_DARWIN:
             self.check_macos_permissions()
         
         # Check if OBS is already running before attempting to start it
@@ -107,6 +210,10 @@ class MainInterface(QWidget):
 
     def check_macos_permissions(self):
         """Guide the user through setting up required permissions on macOS."""
+        # Only walk the user through this until the permission probe has succeeded once
+        if os.path.exists(PERMISSIONS_SENTINEL):
+            return
+        
         # Inform the user about required permissions
         QMessageBox.information(
             self, 
@@ -118,225 +225,245 @@ class MainInterface(QWidget):
             "You may be prompted to allow these permissions. Please grant them when asked."
         )
         
-        # For debugging, try to trigger permission checks
-        import subprocess
-        try:
-            subprocess.run(
-                ["osascript", "-e", 'tell application "System Events" to keystroke ""'],
-                capture_output=True, timeout=1
-            )
-        except:
-            pass
-
-    def ensure_obs_running(self):
-        """Make sure OBS is running, launching it if necessary."""
-        if not is_obs_running():
+        # Try to trigger permission checks without blocking startup on osascript
+        self.permission_probe = QProcess(self)
+        
+        def on_probe_finished(exit_code, exit_status):
+            if exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0:
+                try:
+                    open(PERMISSIONS_SENTINEL, 'w').close()
+                except OSError as e:
+                    logger.warning(f"Could not write permissions sentinel: {e}")
+        
+        self.permission_probe.finished.connect(on_probe_finished)
+        self.permission_probe.start("osascript", ["-e", 'tell application "System Events" to keystroke ""'])
+
+    def ensure_obs_running(self, on_ready=None):
+        """
+        Make sure OBS is running, launching it if necessary.
+        Polls for the OBS websocket on a timer instead of blocking, calling on_ready once it accepts connections.
+        If a poll is already running, on_ready is called when that one finishes.
+        """
+        from ducktrack.obs_client import is_obs_running, is_obs_websocket_ready, open_obs
+        
+        if self._waiting_for_obs:
+            if on_ready is not None:
+                self._pending_on_ready = on_ready
+            return
+        
+        if is_obs_websocket_ready():
+            logger.info("OBS is already running")
+            if on_ready is not None:
+                on_ready()
+            return
+        
+        # OBS may have been started but not be accepting connections yet, then it only needs waiting for
+        if is_obs_running():
+            logger.info("OBS is running, waiting for its WebSocket")
+        else:
             try:
-                print("Starting OBS...")
+                logger.info("Starting OBS...")
                 self.obs_process = open_obs()
-                # Wait a moment for OBS to initialize
-                time.sleep(2)
             except Exception as e:
                 self.display_error_message(f"Failed to start OBS: {str(e)}\nPlease start OBS manually.")
+                return
+        
+        self._waiting_for_obs = True
+        self._pending_on_ready = on_ready
+        deadline = time.monotonic() + self.OBS_READY_TIMEOUT
+        QTimer.singleShot(self.OBS_POLL_INTERVAL_MS, lambda: self._check_obs_ready(deadline))
+
+    def _check_obs_ready(self, deadline: float):
+        from ducktrack.obs_client import is_obs_websocket_ready
+        
+        # the process shows up long before OBS accepts websocket connections, so wait for those
+        if is_obs_websocket_ready():
+            on_ready = self._finish_obs_wait()
+            if on_ready is not None:
+                on_ready()
+        elif time.monotonic() < deadline:
+            QTimer.singleShot(self.OBS_POLL_INTERVAL_MS, lambda: self._check_obs_ready(deadline))
         else:
-            print("OBS is already running")
+            if self._finish_obs_wait() is not None:
+                self.display_error_message("OBS did not start accepting WebSocket connections in time. "
+                                           "Please make sure OBS is running with the WebSocket server enabled and try again.")
+            else:
+                logger.warning("OBS WebSocket did not become ready in time")
+
+    def _finish_obs_wait(self):
+        """Ends the OBS poll, returning the on_ready callback that was waiting on it."""
+        on_ready, self._pending_on_ready = self._pending_on_ready, None
+        self._waiting_for_obs = False
+        return on_ready
 
     def init_window(self):
         self.setWindowTitle("DuckTrack")
         layout = QVBoxLayout(self)
         
-        self.toggle_record_button = QPushButton("Start Recording", self)
-        self.toggle_record_button.clicked.connect(self.toggle_record)
-        layout.addWidget(self.toggle_record_button)
-        
-        self.toggle_pause_button = QPushButton("Pause Recording", self)
-        self.toggle_pause_button.clicked.connect(self.toggle_pause)
-        self.toggle_pause_button.setEnabled(False)
-        layout.addWidget(self.toggle_pause_button)
-        
-        self.show_recordings_button = QPushButton("Show Recordings", self)
-        self.show_recordings_button.clicked.connect(lambda: open_file(get_recordings_dir()))
-        layout.addWidget(self.show_recordings_button)
+        # Buttons share the tray's actions, so text and enabled state stay in sync automatically
+        for action in self.window_actions:
+            button = QToolButton(self)
+            button.setDefaultAction(action)
+            button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
+            button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+            layout.addWidget(button)
         
-        self.play_latest_button = QPushButton("Play Latest Recording", self)
-        self.play_latest_button.clicked.connect(self.play_latest_recording)
-        layout.addWidget(self.play_latest_button)
-        
-        self.play_custom_button = QPushButton("Play Custom Recording", self)
-        self.play_custom_button.clicked.connect(self.play_custom_recording)
-        layout.addWidget(self.play_custom_button)
-        
-        self.replay_recording_button = QPushButton("Replay Recording", self)
-        self.replay_recording_button.clicked.connect(self.replay_recording)
-        self.replay_recording_button.setEnabled(False)
-        layout.addWidget(self.replay_recording_button)
-        
-        # Add a view logs button
-        self.view_logs_button = QPushButton("View Debug Logs", self)
-        self.view_logs_button.clicked.connect(self.show_log_viewer)
-        layout.addWidget(self.view_logs_button)
-        
-        self.quit_button = QPushButton("Quit", self)
-        self.quit_button.clicked.connect(self.quit)
-        layout.addWidget(self.quit_button)
-        
-        self.natural_scrolling_checkbox = QCheckBox("Natural Scrolling", self, checked=system() == "Darwin")
+        self.natural_scrolling_checkbox = QCheckBox("Natural Scrolling", self, checked=self.natural_scrolling_action.isChecked())
         layout.addWidget(self.natural_scrolling_checkbox)
 
-        self.natural_scrolling_checkbox.stateChanged.connect(self.toggle_natural_scrolling)
+        # setChecked only emits on an actual change, so mirroring both ways can't loop
+        self.natural_scrolling_checkbox.toggled.connect(self.natural_scrolling_action.setChecked)
+        self.natural_scrolling_action.toggled.connect(self.natural_scrolling_checkbox.setChecked)
         
         self.setLayout(layout)
         
     def init_tray(self):
         self.menu = QMenu()
         self.tray.setContextMenu(self.menu)
-
-        self.toggle_record_action = QAction("Start Recording")
-        self.toggle_record_action.triggered.connect(self.toggle_record)
-        self.menu.addAction(self.toggle_record_action)
-
-        self.toggle_pause_action = QAction("Pause Recording")
-        self.toggle_pause_action.triggered.connect(self.toggle_pause)
-        self.toggle_pause_action.setVisible(False)
-        self.menu.addAction(self.toggle_pause_action)
-        
-        self.show_recordings_action = QAction("Show Recordings")
-        self.show_recordings_action.triggered.connect(lambda: open_file(get_recordings_dir()))
-        self.menu.addAction(self.show_recordings_action)
-        
-        self.play_latest_action = QAction("Play Latest Recording")
-        self.play_latest_action.triggered.connect(self.play_latest_recording)
-        self.menu.addAction(self.play_latest_action)
-
-        self.play_custom_action = QAction("Play Custom Recording")
-        self.play_custom_action.triggered.connect(self.play_custom_recording)
-        self.menu.addAction(self.play_custom_action)
         
-        self.replay_recording_action = QAction("Replay Recording")
-        self.replay_recording_action.triggered.connect(self.replay_recording)
-        self.menu.addAction(self.replay_recording_action)
-        self.replay_recording_action.setVisible(False)
-
-        self.quit_action = QAction("Quit")
-        self.quit_action.triggered.connect(self.quit)
-        self.menu.addAction(self.quit_action)
+        # (attribute, text, slot, shown in tray), every action also gets a button in the window
+        actions = [
+            ("toggle_record_action", "Start Recording", self.toggle_record, True),
+            ("toggle_pause_action", "Pause Recording", self.toggle_pause, True),
+            ("show_recordings_action", "Show Recordings", self.show_recordings, True),
+            ("play_latest_action", "Play Latest Recording", self.play_latest_recording, True),
+            ("play_custom_action", "Play Custom Recording", self.play_custom_recording, True),
+            ("replay_recording_action", "Replay Recording", self.replay_recording, True),
+            ("view_logs_action", "View Debug Logs", self.show_log_viewer, False),
+            ("quit_action", "Quit", self.quit, True),
+        ]
+        
+        self.window_actions = []
+        for name, text, slot, in_tray in actions:
+            action = QAction(text, self)
+            action.triggered.connect(slot)
+            setattr(self, name, action)
+            self.window_actions.append(action)
+            if in_tray:
+                self.menu.addAction(action)
+        
+        self.toggle_pause_action.setEnabled(False)
+        self.replay_recording_action.setEnabled(False)
         
         self.menu.addSeparator()
         
-        self.natural_scrolling_option = QAction("Natural Scrolling", checkable=True, checked=system() == "Darwin")
-        self.natural_scrolling_option.triggered.connect(self.toggle_natural_scrolling)
-        self.menu.addAction(self.natural_scrolling_option)
+        self.natural_scrolling_action = QAction("Natural Scrolling", self, checkable=True, checked=_IS_DARWIN)
+        self.menu.addAction(self.natural_scrolling_action)
         
+    def get_player(self):
+        if self._player is None:
+            from ducktrack.playback import Player
+            self._player = Player()
+        self._player.reset()
+        return self._player
+
+    @pyqtSlot()
+    def show_recordings(self):
+        from ducktrack.util import get_recordings_dir, open_file
+        
+        open_file(get_recordings_dir())
+
     @pyqtSlot()
     def replay_recording(self):
-        player = Player()
-        if hasattr(self, "last_played_recording_path"):
-            player.play(self.last_played_recording_path)
+        if self.last_played_recording_path is not None:
+            self.get_player().play(self.last_played_recording_path)
         else:
             self.display_error_message("No recording has been played yet!")
 
     @pyqtSlot()
     def play_latest_recording(self):
-        player = Player()
+        from ducktrack.playback import get_latest_recording
+        
         recording_path = get_latest_recording()
         self.last_played_recording_path = recording_path
-        self.replay_recording_action.setVisible(True)
-        self.replay_recording_button.setEnabled(True)
-        player.play(recording_path)
+        self.replay_recording_action.setEnabled(True)
+        self.get_player().play(recording_path)
 
     @pyqtSlot()
     def play_custom_recording(self):
-        player = Player()
+        from ducktrack.util import get_recordings_dir
+        
         directory = QFileDialog.getExistingDirectory(None, "Select Recording", get_recordings_dir())
         if directory:
             self.last_played_recording_path = directory
-            self.replay_recording_button.setEnabled(True)
-            self.replay_recording_action.setVisible(True)
-            player.play(directory)
+            self.replay_recording_action.setEnabled(True)
+            self.get_player().play(directory)
 
     @pyqtSlot()
     def quit(self):
-        print("Shutting down DuckTrack...")
+        logger.info("Quitting application...")
+        self.app.quit()
+
+    def _cleanup(self):
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
+        
+        logger.info("Shutting down DuckTrack...")
         
         # First stop any active recording
-        if hasattr(self, "recorder_thread"):
-            print("Stopping active recording...")
+        if self.recorder_thread is not None:
+            logger.info("Stopping active recording...")
             try:
                 self.recorder_thread.stop_recording()
-                self.recorder_thread.terminate()
-                del self.recorder_thread
+                if not self.recorder_thread.wait(self.recorder_thread.STOP_TIMEOUT_MS):
+                    self.recorder_thread.terminate()
+                # The files are synced in the background, which wouldn't survive the process exiting
+                self.recorder_thread.wait_for_sync()
+                self.recorder_thread.deleteLater()
+                self.recorder_thread = None
             except Exception as e:
-                print(f"Error stopping recording: {e}")
+                logger.error(f"Error stopping recording: {e}")
+        
+        if self._player is not None:
+            self._player.close()
+            self._player = None
         
         # Only close OBS if we started it
-        if hasattr(self, "obs_process") and self.obs_process:
-            print("Closing OBS...")
+        if self.obs_process is not None:
+            logger.info("Closing OBS...")
             try:
+                from ducktrack.obs_client import close_obs
                 close_obs(self.obs_process)
                 self.obs_process = None
             except Exception as e:
-                print(f"Error closing OBS: {e}")
-        
-        print("Quitting application...")
-        self.app.quit()
+                logger.error(f"Error closing OBS: {e}")
 
     def closeEvent(self, event):
-        self.quit()
-
-    @pyqtSlot()
-    def toggle_natural_scrolling(self):
-        sender = self.sender()
-
-        if sender == self.natural_scrolling_checkbox:
-            state = self.natural_scrolling_checkbox.isChecked()
-            self.natural_scrolling_option.setChecked(state)
-        else:
-            state = self.natural_scrolling_option.isChecked()
-            self.natural_scrolling_checkbox.setChecked(state)
+        self.app.quit()
 
     @pyqtSlot()
     def toggle_pause(self):
         if self.recorder_thread._is_paused:
             self.recorder_thread.resume_recording()
             self.toggle_pause_action.setText("Pause Recording")
-            self.toggle_pause_button.setText("Pause Recording")
         else:
             self.recorder_thread.pause_recording()
             self.toggle_pause_action.setText("Resume Recording")
-            self.toggle_pause_button.setText("Resume Recording")
 
     @pyqtSlot()
     def toggle_record(self):
-        if not hasattr(self, "recorder_thread"):
-            # Make sure OBS is running before starting a recording
-            if not is_obs_running():
-                try:
-                    print("OBS not running, attempting to start it...")
-                    self.ensure_obs_running()
-                    # Wait a bit for OBS to initialize
-                    time.sleep(3)
-                    if not is_obs_running():
-                        self.display_error_message("Failed to start OBS. Please start OBS manually and try again.")
-                        return
-                except Exception as e:
-                    self.display_error_message(f"Error starting OBS: {str(e)}\nPlease start OBS manually.")
-                    return
-            
+        if self._recording_state == "finalizing":
+            return
+        
+        if self.recorder_thread is None:
+            # Make sure OBS is running before starting a recording, if OBS is still starting up
+            # the recording starts once it is ready
             try:
-                self.recorder_thread = Recorder(natural_scrolling=self.natural_scrolling_checkbox.isChecked())
-                self.recorder_thread.recording_stopped.connect(self.on_recording_stopped)
-                self.recorder_thread.start()
-                self.update_menu(True)
+                self.ensure_obs_running(on_ready=self.start_recording)
             except Exception as e:
-                self.display_error_message(f"Error starting recording: {str(e)}")
+                self.display_error_message(f"Error starting OBS: {str(e)}\nPlease start OBS manually.")
         else:
             try:
+                self._set_state("finalizing")
                 self.recorder_thread.stop_recording()
-                self.recorder_thread.terminate()
+                if not self.recorder_thread.wait(self.recorder_thread.STOP_TIMEOUT_MS):
+                    self.recorder_thread.terminate()
 
                 recording_dir = self.recorder_thread.recording_path
 
-                del self.recorder_thread
+                self.recorder_thread.deleteLater()
+                self.recorder_thread = None
                 
                 # Show dialog to get title and description
                 dialog = TitleDescriptionDialog(self)  # Pass self as parent
@@ -350,60 +477,59 @@ class MainInterface(QWidget):
 
                 if result == QDialog.DialogCode.Accepted:
                     title, description = dialog.get_values()
-
-                    # Use default title if empty
-                    if not title:
-                        title = f"Recording-{datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}"
-                    
-                    # Rename the directory with the title
-                    renamed_dir = os.path.join(os.path.dirname(recording_dir), title)
-                    try:
-                        os.rename(recording_dir, renamed_dir)
-                        print(f"Renamed recording directory to {renamed_dir}")
-                    except Exception as e:
-                        print(f"Error renaming directory: {e}")
-                        renamed_dir = recording_dir  # Fallback to original directory
                     
                     # Create README with the description (even if empty)
-                    readme_path = os.path.join(renamed_dir, 'README.md')
-                    try:
-                        with open(readme_path, 'w') as f:
-                            f.write(description or "No description provided.")
-                        print(f"Saved README to {readme_path}")
-                    except Exception as e:
-                        print(f"Error writing README: {e}")
+                    task = _FinalizeTask(recording_dir, 
+                                         os.path.join(os.path.dirname(recording_dir), title), 
+                                         description or "No description provided.")
                 else:
                     # User canceled - still create a default README
-                    try:
-                        with open(os.path.join(recording_dir, 'README.md'), 'w') as f:
-                            f.write("Recording saved without description.")
-                        print("Created default README.md")
-                    except Exception as e:
-                        print(f"Error creating default README: {e}")
-                    
-                self.on_recording_stopped()
+                    task = _FinalizeTask(recording_dir, None, "Recording saved without description.")
+                
+                # The rename and README write can block on slow or network disks
+                task.signals.finalize_done.connect(self.on_recording_stopped)
+                QThreadPool.globalInstance().start(task)
             except Exception as e:
                 self.display_error_message(f"Error stopping recording: {str(e)}")
                 self.on_recording_stopped()
 
+    def start_recording(self):
+        from ducktrack.recorder import Recorder
+        
+        try:
+            # recording_stopped isn't connected, a stopped recording only counts as done
+            # once _FinalizeTask has renamed it and written its README
+            self.recorder_thread = Recorder(natural_scrolling=self.natural_scrolling_action.isChecked())
+            self.recorder_thread.start()
+            self._set_state("recording")
+        except Exception as e:
+            self.display_error_message(f"Error starting recording: {str(e)}")
+
     @pyqtSlot()
     def on_recording_stopped(self):
-        self.update_menu(False)
+        self._set_state("idle")
+
+    def _set_state(self, state: str):
+        """Moves between the "idle", "recording" and "finalizing" states."""
+        self._recording_state = state
+        self.update_menu(state)
 
-    def update_menu(self, is_recording: bool):
-        self.toggle_record_button.setText("Stop Recording" if is_recording else "Start Recording")
-        self.toggle_record_action.setText("Stop Recording" if is_recording else "Start Recording")
+    def update_menu(self, state: str):
+        self.toggle_record_action.setText("Stop Recording" if state == "recording" else "Start Recording")
+        self.toggle_pause_action.setEnabled(state == "recording")
         
-        self.toggle_pause_button.setEnabled(is_recording)
-        self.toggle_pause_action.setVisible(is_recording)
+        # A recording that is still being renamed can't be followed by a new one or played back yet
+        finalizing = state == "finalizing"
+        self.toggle_record_action.setEnabled(not finalizing)
+        self.play_latest_action.setEnabled(not finalizing)
+        self.play_custom_action.setEnabled(not finalizing)
+        self.replay_recording_action.setEnabled(not finalizing and self.last_played_recording_path is not None)
 
     def display_error_message(self, message):
         QMessageBox.critical(None, "Error", message)
         
     def show_log_viewer(self):
         """Show a dialog with the contents of the log file."""
-        log_file = os.path.expanduser("~/ducktrack.log")
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("DuckTrack Debug Logs")
         dialog.resize(800, 600)
@@ -412,20 +538,7 @@ class MainInterface(QWidget):
         
         log_text = QTextEdit()
         log_text.setReadOnly(True)
-        
-        # Load log file contents
-        try:
-            with open(log_file, 'r') as f:
-                log_content = f.read()
-                log_text.setText(log_content)
-                
-                # Scroll to the end
-                cursor = log_text.textCursor()
-                cursor.movePosition(cursor.MoveOperation.End)
-                log_text.setTextCursor(cursor)
-        except Exception as e:
-            log_text.setText(f"Error loading log file: {str(e)}")
-        
+        log_text.document().setMaximumBlockCount(5000)
         layout.addWidget(log_text)
         
         # Add refresh button
@@ -434,23 +547,71 @@ class MainInterface(QWidget):
         layout.addWidget(refresh_button)
         
         dialog.setLayout(layout)
+        
+        # Load log file contents in the background so large logs don't freeze the UI
+        self.refresh_log_view(log_text)
+        
+        # Append new log lines as they are written, the refresh button stays as a fallback
+        watcher = QFileSystemWatcher([LOG_FILE], dialog)
+        def on_log_changed(path):
+            # some editors and rotators replace the file, which drops it from the watch list
+            if path not in watcher.files() and os.path.exists(path):
+                watcher.addPath(path)
+            self.refresh_log_view(log_text)
+        watcher.fileChanged.connect(on_log_changed)
+        
         dialog.exec()
+        
+        watcher.fileChanged.disconnect(on_log_changed)
+        log_text.log_refresh_pending = False
+        
+        # Don't let a reader outlive its text edit
+        reader = getattr(log_text, "log_reader", None)
+        if reader is not None:
+            reader.requestInterruption()
+            reader.wait()
     
     def refresh_log_view(self, text_edit):
-        """Refresh the log view with the latest content."""
-        log_file = os.path.expanduser("~/ducktrack.log")
-        try:
-            with open(log_file, 'r') as f:
-                log_content = f.read()
-                text_edit.setText(log_content)
-                
-                # Scroll to the end
-                cursor = text_edit.textCursor()
-                cursor.movePosition(cursor.MoveOperation.End)
-                text_edit.setTextCursor(cursor)
-        except Exception as e:
-            text_edit.setText(f"Error loading log file: {str(e)}")
+        """Append anything written to the log since the last read."""
+        reader = getattr(text_edit, "log_reader", None)
+        if reader is not None:
+            if reader.isRunning():
+                # pick up whatever was written during this read once it finishes
+                text_edit.log_refresh_pending = True
+                return
+            offset = reader.offset
+            reader.deleteLater()
+        else:
+            offset = None
+        
+        # Hold off repaints while chunks stream in so the view is laid out and painted once
+        text_edit.setUpdatesEnabled(False)
+        cursor = QTextCursor(text_edit.document())
+        
+        def append_chunk(chunk):
+            cursor.movePosition(cursor.MoveOperation.End)
+            cursor.insertText(chunk)
+        
+        def scroll_to_end():
+            text_edit.setUpdatesEnabled(True)
+            text_edit.moveCursor(QTextCursor.MoveOperation.End)
+            text_edit.ensureCursorVisible()
+            
+            if getattr(text_edit, "log_refresh_pending", False):
+                text_edit.log_refresh_pending = False
+                self.refresh_log_view(text_edit)
+        
+        reader = LogReader(LOG_FILE, offset, text_edit)
+        reader.chunk_read.connect(append_chunk)
+        reader.finished.connect(scroll_to_end)
+        text_edit.log_reader = reader
+        reader.start()
+
+@functools.lru_cache
+def get_duck_icon() -> QIcon:
+    return QIcon(resource_path("assets/duck.png"))
 
+@functools.lru_cache
 def resource_path(relative_path: str) -> str:
     if hasattr(sys, '_MEIPASS'):
         base_path = getattr(sys, "_MEIPASS")
@@ -26,6 +26,10 @@ class KeyCombinationListener:
         if key in self.current_keys:
             self.current_keys.remove(key)
 
+    def reset(self):
+        """Forgets which keys are held down, in case a release was missed."""
+        self.current_keys.clear()
+
     def start(self):
         self.listener.start()
 
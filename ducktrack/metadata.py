@@ -43,9 +43,23 @@ class MetadataManager:
         self.metadata["scroll_direction"] = -1 if natural_scrolling else 1
 
     def save_metadata(self):
+        fd = self.open_metadata_file()
+        try:
+            self.write_metadata(fd)
+        finally:
+            os.close(fd)
+    
+    def open_metadata_file(self) -> int:
+        """Opens metadata.json for writing, returning the raw fd."""
         metadata_path = os.path.join(self.recording_path, "metadata.json")
-        with open(metadata_path, "w") as f:
-            json.dump(self.metadata, f, indent=4)
+        return os.open(metadata_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    
+    def write_metadata(self, fd: int):
+        """Writes the metadata to an open fd, leaving it open."""
+        # serialized up front so the file is written in one go rather than chunk by chunk
+        data = json.dumps(self.metadata, indent=4).encode("utf-8")
+        while data:
+            data = data[os.write(fd, data):]
     
     def collect(self):
         self.metadata["start_time"] = self._get_time_stamp()
@@ -53,7 +67,8 @@ class MetadataManager:
     def end_collect(self):
         self.metadata["stop_time"] = self._get_time_stamp()
     
-    def add_obs_record_state_timings(self, record_state_events: dict[str, float]):
+    def add_obs_record_state_timings(self, record_state_events: dict[str, list[float]]):
+        # kept by reference, not copied, so states OBS reports after this call still end up in the saved metadata
         self.metadata["obs_record_state_timings"] = record_state_events
 
     def _get_time_stamp(self):
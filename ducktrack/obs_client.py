@@ -1,16 +1,80 @@
+import functools
+import json
 import os
+import random
+import shutil
+import socket
 import subprocess
 import time
 import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from platform import system
 
 import obsws_python as obs
-import psutil
 
 # Get logger
 logger = logging.getLogger('DuckTrack.OBSClient')
 
+_SYSTEM = system()
+_IS_MAC = _SYSTEM == "Darwin"
+_IS_WIN = _SYSTEM == "Windows"
+_IS_LINUX = _SYSTEM == "Linux"
+
 def is_obs_running() -> bool:
+    try:
+        # let the OS filter by process name instead of walking every process in Python
+        if _IS_LINUX and os.path.isdir("/proc"):
+            return _linux_is_obs_running()
+        elif _IS_WIN:
+            result = subprocess.run(["tasklist", "/FI", "IMAGENAME eq obs*", "/NH"], 
+                                    capture_output=True, text=True, check=False,
+                                    creationflags=subprocess.CREATE_NO_WINDOW)
+            if result.returncode == 0:
+                return result.stdout.lstrip().lower().startswith("obs")
+        else:
+            result = subprocess.run(["pgrep", "-i", "obs"], capture_output=True, check=False)
+            if result.returncode in (0, 1):
+                return result.returncode == 0
+    except FileNotFoundError:
+        pass
+    except:
+        raise Exception("Could not check if OBS is running already. Please check manually.")
+    
+    return _psutil_is_obs_running()
+
+# obs-websocket's default port, which is what ReqClient connects to without a config.toml
+OBS_WEBSOCKET_PORT = 4455
+
+def is_obs_websocket_ready(timeout=0.05) -> bool:
+    """
+    Checks whether the OBS websocket accepts connections. OBS only opens it once it has started up,
+    well after its process shows up, and a refused connection on localhost fails right away
+    so this is cheap enough to poll from the GUI thread.
+    """
+    try:
+        with socket.create_connection(("localhost", OBS_WEBSOCKET_PORT), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+def _linux_is_obs_running() -> bool:
+    # scandir doesn't stat each entry, and comm is a single short read per process
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/comm") as f:
+                if "obs" in f.read().lower():
+                    return True
+        except OSError:
+            # the process exited or belongs to someone we can't inspect
+            continue
+    return False
+
+def _psutil_is_obs_running() -> bool:
+    import psutil
+    
     try:
         for process in psutil.process_iter(attrs=["pid", "name"]):
             if "obs" in process.info["name"].lower():
@@ -22,18 +86,16 @@ def is_obs_running() -> bool:
 def close_obs(obs_process: subprocess.Popen):
     try:
         if obs_process:
-            if system() == "Darwin":
+            if _IS_MAC:
                 # Use AppleScript to quit OBS gracefully on macOS
                 try:
                     subprocess.run(['osascript', '-e', 'tell application "OBS" to quit'], 
                                   timeout=5, check=False)
-                    # Double-check if it's still running
-                    time.sleep(2)
-                    if is_obs_running():
+                    if not _wait_for_obs_exit(obs_process, timeout=5):
                         # Force kill as last resort
                         subprocess.run(['killall', 'OBS'], check=False)
                 except Exception as e:
-                    logger.error(f"Error gracefully closing OBS: {e}")
+                    logger.error("Error gracefully closing OBS: %s", e)
                     # As a last resort, kill the process
                     if obs_process:
                         obs_process.kill()
@@ -45,16 +107,13 @@ def close_obs(obs_process: subprocess.Popen):
                 except subprocess.TimeoutExpired:
                     logger.error("OBS didn't terminate gracefully, forcing kill")
                     obs_process.kill()
-                    
-        # Wait for OBS to fully close
-        time.sleep(1)
     except Exception as e:
-        logger.error(f"Error closing OBS: {e}")
+        logger.error("Error closing OBS: %s", e)
         # Last resort: try to kill it
         try:
-            if system() == "Darwin":
+            if _IS_MAC:
                 subprocess.run(['killall', 'OBS'], check=False)
-            elif system() == "Windows":
+            elif _IS_WIN:
                 subprocess.run(['taskkill', '/F', '/IM', 'obs64.exe'], check=False)
                 subprocess.run(['taskkill', '/F', '/IM', 'obs32.exe'], check=False)
             else:
@@ -62,36 +121,60 @@ def close_obs(obs_process: subprocess.Popen):
         except:
             pass
 
-def find_obs() -> str:
-    common_paths = {
-        "Windows": [
-            "C:\\Program Files\\obs-studio\\bin\\64bit\\obs64.exe",
-            "C:\\Program Files (x86)\\obs-studio\\bin\\32bit\\obs32.exe"
-        ],
-        "Darwin": [
-            "/Applications/OBS.app/Contents/MacOS/OBS",
-            "/opt/homebrew/bin/obs"
-        ],
-        "Linux": [
-            "/usr/bin/obs",
-            "/usr/local/bin/obs"
-        ]
-    }
-
-    for path in common_paths.get(system(), []):
-        if os.path.exists(path):
-            return path
+def _wait_for_obs_exit(obs_process: subprocess.Popen, timeout: float) -> bool:
+    """
+    Waits for OBS to exit, returning False if it is still running after the timeout.
+    """
+    # `open -a OBS` hands off to LaunchServices and exits right away, so its pid says nothing about OBS
+    if obs_process.args[:2] != ["open", "-a"]:
+        try:
+            obs_process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
     
-    try:
-        if system() == "Windows":
-            obs_path = subprocess.check_output("where obs", shell=True).decode().strip()
-        else:
-            obs_path = subprocess.check_output("which obs", shell=True).decode().strip()
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while is_obs_running():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
+    return True
 
-        if os.path.exists(obs_path):
-            return obs_path
-    except subprocess.CalledProcessError:
-        pass
+_COMMON_OBS_PATHS = {
+    "Windows": [
+        "C:\\Program Files\\obs-studio\\bin\\64bit\\obs64.exe",
+        "C:\\Program Files (x86)\\obs-studio\\bin\\32bit\\obs32.exe"
+    ],
+    "Darwin": [
+        "/Applications/OBS.app/Contents/MacOS/OBS",
+        "/opt/homebrew/bin/obs"
+    ],
+    "Linux": [
+        "/usr/bin/obs",
+        "/usr/local/bin/obs"
+    ]
+}
+_CANDIDATE_PATHS = _COMMON_OBS_PATHS.get(_SYSTEM, [])
+
+@functools.lru_cache(maxsize=1)
+def find_obs() -> str:
+    """
+    Finds the OBS executable. The result is cached for the session,
+    call find_obs.cache_clear() to look it up again.
+    """
+    # stat the candidates concurrently, a slow or network filesystem then costs one stat's latency instead of several
+    with ThreadPoolExecutor(max_workers=max(1, len(_CANDIDATE_PATHS))) as executor:
+        for path, exists in zip(_CANDIDATE_PATHS, executor.map(os.path.exists, _CANDIDATE_PATHS)):
+            if exists:
+                return path
+    
+    # look it up on the PATH without spawning a shell
+    obs_path = (_IS_WIN and shutil.which("obs64")) or shutil.which("obs")
+    if obs_path:
+        return obs_path
 
     return "obs"
 
@@ -99,24 +182,20 @@ def open_obs() -> subprocess.Popen:
     try:
         obs_path = find_obs()
         
-        if system() == "Windows":
-            # you have to change the working directory first for OBS to find the correct locale on windows
-            os.chdir(os.path.dirname(obs_path))
-            obs_path = os.path.basename(obs_path)
-            process = subprocess.Popen([obs_path, "--startreplaybuffer", "--minimize-to-tray"])
-        elif system() == "Darwin":  # macOS specific handling
+        if _IS_WIN:
+            # OBS has to be started from its own directory to find the correct locale on windows
+            process = subprocess.Popen([obs_path, "--startreplaybuffer", "--minimize-to-tray"],
+                                       cwd=os.path.dirname(obs_path) or None)
+        elif _IS_MAC:  # macOS specific handling
             # Use open command on macOS which handles permissions better than direct execution
             process = subprocess.Popen(["open", "-a", "OBS"])
-            # Give OBS some time to initialize before trying to connect
-            time.sleep(2)
         else:  # Linux
             process = subprocess.Popen([obs_path, "--startreplaybuffer", "--minimize-to-tray"])
-            
-        # Give OBS some time to start before returning
-        time.sleep(1)
+        
+        # no need to wait for OBS to come up here, OBSClient keeps retrying the websocket until it does
         return process
     except Exception as e:
-        logger.error(f"Error launching OBS: {e}")
+        logger.error("Error launching OBS: %s", e)
         raise Exception("Failed to find OBS, please open OBS manually.")
 
 class OBSClient:
@@ -125,6 +204,12 @@ class OBSClient:
     Sets all the correct settings for recording.
     """
     
+    # how long to keep retrying the websocket. MainInterface only builds the client once
+    # the websocket port accepts connections, so this just covers the handshake.
+    # The client is built on the GUI thread, so this is kept to what the old three tries
+    # with 2 seconds between them would block for
+    CONNECT_TIMEOUT = 4.0
+    
     def __init__(
         self, 
         recording_path: str, 
@@ -135,22 +220,29 @@ class OBSClient:
     ):
         self.metadata = metadata
         
-        # Try to connect to OBS with a retry mechanism
-        max_retries = 3
-        for attempt in range(max_retries):
+        # Try to connect to OBS with a retry mechanism, backing off exponentially
+        # so a WebSocket that is ready almost immediately isn't waited on for seconds
+        deadline = time.monotonic() + self.CONNECT_TIMEOUT
+        attempt = 0
+        while True:
             try:
-                logger.info(f"Attempting to connect to OBS WebSocket (attempt {attempt+1}/{max_retries})")
+                logger.info("Attempting to connect to OBS WebSocket (attempt %d)", attempt + 1)
                 self.req_client = obs.ReqClient()
-                self.event_client = obs.EventClient()
+                # RecordStateChanged is the only event we listen for
+                self.event_client = obs.EventClient(subs=obs.Subs.OUTPUTS)
                 break
             except Exception as e:
-                logger.error(f"Failed to connect to OBS WebSocket: {e}")
-                if attempt < max_retries - 1:
-                    logger.info(f"Retrying in 2 seconds...")
-                    time.sleep(2)
-                else:
-                    logger.error("Maximum retry attempts reached. Please ensure OBS is running with WebSocket enabled.")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.error("Failed to connect to OBS WebSocket: %s", e)
+                    logger.error("Connection timed out. Please ensure OBS is running with WebSocket enabled.")
                     raise Exception("Failed to connect to OBS WebSocket after multiple attempts")
+                
+                # OBS is most likely still starting up
+                delay = min(0.01 * (2 ** attempt) + random.uniform(0, 0.01), 2.0, remaining)
+                logger.info("OBS WebSocket not ready (%s), retrying in %.2f seconds...", e, delay)
+                time.sleep(delay)
+                attempt += 1
         
         self.record_state_events = {}
         
@@ -174,11 +266,12 @@ class OBSClient:
                 time.sleep(3)
             
             # Now proceed with profile operations
-            self.old_profile = self.req_client.get_profile_list().current_profile_name
+            profile_list = self.req_client.get_profile_list()
+            self.old_profile = profile_list.current_profile_name
 
             # Profile creation/management with error handling
             try:
-                profiles = self.req_client.get_profile_list().profiles
+                profiles = profile_list.profiles
                 if "computer_tracker" not in profiles:
                     self.req_client.create_profile("computer_tracker")
                 
@@ -201,30 +294,30 @@ class OBSClient:
             
             scaled_width, scaled_height = _scale_resolution(base_width, base_height, output_width, output_height)
             
-            self.req_client.set_profile_parameter("Video", "BaseCX", str(base_width))
-            self.req_client.set_profile_parameter("Video", "BaseCY", str(base_height))
-            self.req_client.set_profile_parameter("Video", "OutputCX", str(scaled_width))
-            self.req_client.set_profile_parameter("Video", "OutputCY", str(scaled_height))
-            self.req_client.set_profile_parameter("Video", "ScaleType", "lanczos")
-
-            self.req_client.set_profile_parameter("AdvOut", "RescaleRes", f"{base_width}x{base_height}")
-            self.req_client.set_profile_parameter("AdvOut", "RecRescaleRes", f"{base_width}x{base_height}")
-            self.req_client.set_profile_parameter("AdvOut", "FFRescaleRes", f"{base_width}x{base_height}")
-
-            self.req_client.set_profile_parameter("Video", "FPSCommon", str(fps))
-            self.req_client.set_profile_parameter("Video", "FPSInt", str(fps))
-            self.req_client.set_profile_parameter("Video", "FPSNum", str(fps))
-            self.req_client.set_profile_parameter("Video", "FPSDen", "1")
-            
-            self.req_client.set_profile_parameter("SimpleOutput", "RecFormat2", "mp4")
-            
-            bitrate = int(_get_bitrate_mbps(scaled_width, scaled_height, fps=fps) * 1000 / 50) * 50
-            self.req_client.set_profile_parameter("SimpleOutput", "VBitrate", str(bitrate))
+            bitrate = _get_bitrate_kbps_quantized(scaled_width, scaled_height, fps=fps)
             
-            # do this in order to get pause & resume
-            self.req_client.set_profile_parameter("SimpleOutput", "RecQuality", "Small")
+            self._set_profile_parameters([
+                ("Video", "BaseCX", str(base_width)),
+                ("Video", "BaseCY", str(base_height)),
+                ("Video", "OutputCX", str(scaled_width)),
+                ("Video", "OutputCY", str(scaled_height)),
+                ("Video", "ScaleType", "lanczos"),
 
-            self.req_client.set_profile_parameter("SimpleOutput", "FilePath", recording_path)
+                ("AdvOut", "RescaleRes", f"{base_width}x{base_height}"),
+                ("AdvOut", "RecRescaleRes", f"{base_width}x{base_height}"),
+                ("AdvOut", "FFRescaleRes", f"{base_width}x{base_height}"),
+
+                ("Video", "FPSCommon", str(fps)),
+                ("Video", "FPSInt", str(fps)),
+                ("Video", "FPSNum", str(fps)),
+                ("Video", "FPSDen", "1"),
+                
+                ("SimpleOutput", "RecFormat2", "mp4"),
+                ("SimpleOutput", "VBitrate", str(bitrate)),
+                # do this in order to get pause & resume
+                ("SimpleOutput", "RecQuality", "Small"),
+                ("SimpleOutput", "FilePath", recording_path),
+            ])
         
             # TODO: not all OBS configs have this, maybe just instruct the user to mute themselves
 
@@ -239,6 +332,63 @@ class OBSClient:
             # Continue with the current profile
             logger.info("Continuing with the current OBS profile")
 
+    def _set_profile_parameters(self, parameters: list[tuple[str, str, str]]):
+        """
+        Sets several profile parameters in a single obs-websocket RequestBatch round trip.
+        obsws_python has no batch API, so the batch is sent on the request client's socket directly,
+        falling back to one request per parameter if that fails.
+        """
+        payload = {
+            "op": 8,  # RequestBatch
+            "d": {
+                "requestId": str(uuid.uuid4()),
+                "haltOnFailure": False,
+                "executionType": 0,  # SerialRealtime
+                "requests": [
+                    {
+                        "requestType": "SetProfileParameter",
+                        "requestData": {
+                            "parameterCategory": category,
+                            "parameterName": name,
+                            "parameterValue": value,
+                        },
+                    }
+                    for category, name, value in parameters
+                ],
+            },
+        }
+        
+        ws = self.req_client.base_client.ws
+        try:
+            ws.send(json.dumps(payload))
+        except Exception as e:
+            logger.warning("Sending the batched profile update failed, setting parameters one by one: %s", e)
+            self._set_profile_parameters_one_by_one(parameters)
+            return
+        
+        try:
+            response = json.loads(ws.recv())
+            if response.get("op") != 9:  # RequestBatchResponse
+                raise ValueError(f"unexpected response to request batch: {response}")
+        except Exception as e:
+            # ReqClient doesn't match responses to requests, so once the batch is out a late
+            # RequestBatchResponse would be read as the reply to the next request.
+            # Start over on a fresh connection instead
+            logger.warning("Batched profile update failed, reconnecting and setting parameters one by one: %s", e)
+            ws.close()
+            self.req_client = obs.ReqClient()
+            self._set_profile_parameters_one_by_one(parameters)
+            return
+        
+        for (category, name, _), result in zip(parameters, response["d"]["results"]):
+            if not result["requestStatus"]["result"]:
+                logger.warning("Unable to set profile parameter %s/%s: %s", 
+                               category, name, result["requestStatus"].get("comment"))
+
+    def _set_profile_parameters_one_by_one(self, parameters: list[tuple[str, str, str]]):
+        for category, name, value in parameters:
+            self.req_client.set_profile_parameter(category, name, value)
+
     def start_recording(self):
         self.req_client.start_record()
 
@@ -258,30 +408,35 @@ class OBSClient:
     def resume_recording(self):
         self.req_client.resume_record()
    
-def _get_bitrate_mbps(width: int, height: int, fps=30) -> float:
+# YouTube recommended bitrates in kbps, keyed by (width, height, fps)
+_YT_BITRATES: dict[tuple[int, int, int], int] = {
+    (7680, 4320, 30): 120000, (7680, 4320, 60): 180000,
+    (3840, 2160, 30): 40000,  (3840, 2160, 60): 60500,
+    (2160, 1440, 30): 16000,  (2160, 1440, 60): 24000,
+    (1920, 1080, 30): 8000,   (1920, 1080, 60): 12000,
+    (1280, 720, 30):  5000,   (1280, 720, 60):  7500,
+    (640, 480, 30):   2500,   (640, 480, 60):   4000,
+    (480, 360, 30):   1000,   (480, 360, 60):   1500,
+}
+
+@functools.lru_cache(maxsize=32)
+def _get_bitrate_kbps_quantized(width: int, height: int, fps=30, quantum=50) -> int:
     """
-    Gets the YouTube recommended bitrate in Mbps for a given resolution and framerate.
+    Gets the YouTube recommended bitrate in kbps for a given resolution and framerate, 
+    rounded down to a multiple of quantum.
     Refer to https://support.google.com/youtube/answer/1722171?hl=en#zippy=%2Cbitrate
     """
-    resolutions = {
-        (7680, 4320): {30: 120, 60: 180},
-        (3840, 2160): {30: 40,  60: 60.5},
-        (2160, 1440): {30: 16,  60: 24},
-        (1920, 1080): {30: 8,   60: 12},
-        (1280, 720):  {30: 5,   60: 7.5},
-        (640, 480):   {30: 2.5, 60: 4},
-        (480, 360):   {30: 1,   60: 1.5}
-    }
-
-    if (width, height) in resolutions:
-        return resolutions[(width, height)].get(fps)
-    else:
+    kbps = _YT_BITRATES.get((width, height, fps))
+    if kbps is None:
         # approximate the bitrate using a simple linear model
         area = width * height
-        multiplier = 3.5982188179592543e-06 if fps == 30 else 5.396175171097084e-06
-        constant = 2.418399836285939 if fps == 30 else 3.742780056500365
-        return multiplier * area + constant
+        multiplier = 3.5982188179592543e-03 if fps == 30 else 5.396175171097084e-03
+        constant = 2418.399836285939 if fps == 30 else 3742.780056500365
+        kbps = int(multiplier * area + constant)
+    
+    return (kbps // quantum) * quantum
 
+@functools.lru_cache(maxsize=32)
 def _scale_resolution(base_width: int, base_height: int, target_width: int,  target_height: int) -> tuple[int, int]:
     target_area = target_width * target_height
     aspect_ratio = base_width / base_height
@@ -24,14 +24,30 @@ class Player:
     
     def __init__(self):
         self.stop_playback = False
+        
+        self.mouse_controller = MouseController()
+        self.keyboard_controller = KeyboardController()
+        
+        # the stop combination listener stays alive for the lifetime of the player
         self.listener = KeyCombinationListener()
         
         def stop_comb_pressed():
             self.stop_playback = True
-            return False
         
         self.listener.add_comb(("shift", "esc"), stop_comb_pressed)
         self.listener.start()
+    
+    def reset(self):
+        """
+        Clears per-playback state so the player can be reused.
+        """
+        self.stop_playback = False
+        # the listener stays alive between playbacks, a key it saw go down but never up
+        # (e.g. released while the app was busy) would otherwise count towards the stop combination
+        self.listener.reset()
+    
+    def close(self):
+        self.listener.stop()
             
     def play(self, recording_path: str):
         with open(os.path.join(recording_path, "events.jsonl"), "r") as f:
@@ -46,11 +62,10 @@ class Player:
         if metadata["system"] == "Windows":
             fix_windows_dpi_scaling()
              
-        mouse_controller = MouseController()
-        keyboard_controller = KeyboardController()
+        mouse_controller = self.mouse_controller
+        keyboard_controller = self.keyboard_controller
 
         if not events:
-            self.listener.stop()
             return
 
         presses_to_skip = 0
@@ -153,8 +168,6 @@ class Player:
                     wait_until = time.perf_counter() + delay
                     while time.perf_counter() < wait_until:
                         pass
-        
-        self.listener.stop()
 
 def get_latest_recording() -> str:
     recordings_dir = get_recordings_dir()
@@ -179,6 +192,7 @@ def main():
         recording_path = get_latest_recording()
             
     player.play(recording_path)
+    player.close()
         
 if __name__ == "__main__":
     n = 3
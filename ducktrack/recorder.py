@@ -1,12 +1,14 @@
 import json
 import os
+import re
 import time
 import subprocess
 import logging
 import threading
-from datetime import datetime
+from collections import deque
+from contextlib import ExitStack
 from platform import system
-from queue import Queue, Empty
+from queue import SimpleQueue, Empty
 
 from pynput import keyboard, mouse
 from pynput.keyboard import KeyCode
@@ -20,6 +22,138 @@ from .util import fix_windows_dpi_scaling, get_recordings_dir
 # Get the logger
 logger = logging.getLogger('DuckTrack.Recorder')
 
+class _InputLogRateLimiter(logging.Filter):
+    """
+    Drops INFO and DEBUG records from the input callbacks logged more often than once per interval,
+    so bursts of clicks and key presses don't flood the log.
+    """
+    
+    CALLBACKS = frozenset({"on_move", "on_click", "on_scroll", "on_press", "on_release", "macos_on_input"})
+    
+    def __init__(self, interval: float):
+        super().__init__()
+        self.interval = interval
+        self._last_emitted: dict[str, float] = {}
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO or record.funcName not in self.CALLBACKS:
+            return True
+        
+        if record.created - self._last_emitted.get(record.funcName, 0.0) < self.interval:
+            return False
+        self._last_emitted[record.funcName] = record.created
+        return True
+
+logger.addFilter(_InputLogRateLimiter(0.1))
+
+_PLATFORM = system()
+
+# asks System Events for the mouse position, which also fails without Accessibility permissions
+_MOUSE_POSITION_SCRIPT = 'tell application "System Events"\ntry\nget the position of the mouse\non error\nreturn {0, 0}\nend try\nend tell'
+# parses the script's "x, y" output
+_POS_RE = re.compile(rb'\s*(-?\d+),\s*(-?\d+)\s*$')
+
+# orjson is optional, it serializes straight to bytes and is a lot faster than the stdlib encoder
+try:
+    import orjson
+    
+    def _dumps_line(event: dict) -> bytes:
+        return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    # compact separators like orjson, the encoder is built once instead of on every dumps call
+    _encode = json.JSONEncoder(separators=(",", ":")).encode
+    
+    def _dumps_line(event: dict) -> bytes:
+        return (_encode(event) + "\n").encode("utf-8")
+
+# field names of the input events, which are queued as plain tuples in this order 
+# and only turned into dicts once they are serialized off the input threads
+_EVENT_FIELDS = {
+    "move": ("time_stamp", "action", "x", "y"),
+    "click": ("time_stamp", "action", "x", "y", "button", "pressed"),
+    "scroll": ("time_stamp", "action", "x", "y", "dx", "dy"),
+    "press": ("time_stamp", "action", "name"),
+    "release": ("time_stamp", "action", "name"),
+    "pause": ("time_stamp", "action"),
+    "resume": ("time_stamp", "action"),
+}
+
+def _event_line(event: dict | tuple) -> bytes:
+    if type(event) is tuple:
+        event = dict(zip(_EVENT_FIELDS[event[1]], event))
+    return _dumps_line(event)
+
+# mouse button names, looked up once per button instead of going through the enum on every click
+_BUTTON_NAMES: dict[mouse.Button, str] = {}
+
+# writev takes at most this many buffers per call on Linux and macOS
+_IOV_MAX = 1024
+
+def _write_all(fd: int, chunks: list[bytes]):
+    """Writes all the chunks to fd, gathered into a single writev call where the platform has it."""
+    if not hasattr(os, "writev"):  # Windows
+        data = b"".join(chunks)
+        while data:
+            data = data[os.write(fd, data):]
+        return
+    
+    for i in range(0, len(chunks), _IOV_MAX):
+        group = chunks[i:i + _IOV_MAX]
+        written = os.writev(fd, group)
+        
+        # a short write leaves the rest of the group for plain writes
+        if written < sum(map(len, group)):
+            data = b"".join(group)[written:]
+            while data:
+                data = data[os.write(fd, data):]
+
+def _sync_fd(fd: int):
+    """Makes sure the file's data has reached the disk."""
+    if _PLATFORM == "Darwin":
+        import fcntl
+        
+        # fsync on macOS only hands the data to the drive, which may keep it in its cache
+        fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+    elif hasattr(os, "fdatasync"):
+        # skips flushing metadata like timestamps that isn't needed to read the data back
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+class PreciseTimer:
+    """
+    Ticks at a fixed interval on absolute monotonic deadlines, 
+    so wake-ups don't drift by however long the work between them took.
+    """
+    
+    def __init__(self, interval_s: float):
+        self.interval = interval_s
+        self.next_deadline = time.monotonic() + interval_s
+        self._cancelled = threading.Event()
+    
+    def remaining(self) -> float:
+        """Seconds left until the next tick."""
+        return max(0.0, self.next_deadline - time.monotonic())
+    
+    def wait(self) -> bool:
+        """Blocks until the next tick, returns False if the timer was cancelled instead."""
+        if self._cancelled.wait(self.remaining()):
+            return False
+        self._advance()
+        return True
+    
+    def cancel(self):
+        """Wakes up any wait() right away."""
+        self._cancelled.set()
+    
+    def _advance(self):
+        self.next_deadline += self.interval
+        now = time.monotonic()
+        if self.next_deadline <= now:
+            # skip the ticks that were missed entirely rather than firing them all back to back
+            missed = int((now - self.next_deadline) / self.interval) + 1
+            self.next_deadline += missed * self.interval
+
 class MacOSInputMonitor:
     """Alternative input monitor for macOS using periodic sentinel events as fallback."""
     
@@ -28,12 +162,15 @@ class MacOSInputMonitor:
         self.on_click = on_click
         self.on_key = on_key
         self.monitor_thread = None
+        self.timer = None
         self.permission_check_count = 0
         self.max_permission_checks = 3
+        self._read_mouse_position = None
         
     def start(self):
         """Start the monitoring thread."""
         self.running = True
+        self.timer = PreciseTimer(2.0)
         self.monitor_thread = threading.Thread(target=self._run_monitor)
         self.monitor_thread.daemon = True
         self.monitor_thread.start()
@@ -43,6 +180,9 @@ class MacOSInputMonitor:
     def stop(self):
         """Stop the monitoring thread."""
         self.running = False
+        if self.timer:
+            # wakes the monitor thread right away, so the join doesn't have to wait out a tick
+            self.timer.cancel()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=1.0)
         logger.info("Stopped macOS fallback input monitor")
@@ -51,16 +191,14 @@ class MacOSInputMonitor:
         """Run a basic monitor that adds periodic sentinel events."""
         logger.info("MacOS monitor thread started")
         
-        last_sentinel_time = time.time()
+        ticks = 0
         
-        while self.running:
+        # The timer is the only gate, every tick reads the mouse once and adds one sentinel
+        while self.running and self.timer.wait():
             try:
-                current_time = time.time()
-                
                 # Try to get mouse position only a few times, then give up to avoid log spam
                 if self.permission_check_count < self.max_permission_checks:
                     try:
-                        # Try to get mouse position using AppleScript
                         x, y = self._get_mouse_position()
                         # If we succeeded, report the position
                         if x > 0 or y > 0:
@@ -73,64 +211,129 @@ class MacOSInputMonitor:
                         if self.permission_check_count >= self.max_permission_checks:
                             logger.warning("Giving up on mouse position detection after multiple failures")
                 
-                # Add a sentinel event every 2 seconds
-                if current_time - last_sentinel_time > 2:
-                    # Create a sentinel event with the current timestamp
-                    if self.on_click:
-                        self.on_click(0, 0, None, None, event_type="sentinel")
-                    
-                    # Log periodically
-                    if (int(current_time) % 10) < 1:
-                        logger.info("MacOS fallback monitor adding sentinel events")
-                    
-                    last_sentinel_time = current_time
+                # Create a sentinel event with the current timestamp
+                if self.on_click:
+                    self.on_click(0, 0, None, None, event_type="sentinel")
                 
-                # Sleep briefly to avoid using too much CPU
-                time.sleep(0.5)
+                # Log periodically, about every 10 seconds
+                ticks += 1
+                if ticks % 5 == 0:
+                    logger.info("MacOS fallback monitor adding sentinel events")
                 
             except Exception as e:
                 logger.error(f"Error in macOS monitor: {e}")
-                time.sleep(1.0)
     
     def _get_mouse_position(self):
+        """Get the current mouse position, natively if PyObjC is available."""
+        if self._read_mouse_position is None:
+            self._read_mouse_position = _native_mouse_position_reader() or self._get_mouse_position_applescript
+        return self._read_mouse_position()
+    
+    def _get_mouse_position_applescript(self):
         """Get the current mouse position using AppleScript, with better error handling."""
         try:
             # Use a different AppleScript approach that might have better compatibility
-            script = 'tell application "System Events"\ntry\nget the position of the mouse\non error\nreturn {0, 0}\nend try\nend tell'
-            result = subprocess.run(['osascript', '-e', script], 
-                                   capture_output=True, text=True, check=False)
+            # the output is matched as bytes, there is no need to decode it first
+            result = subprocess.run(['osascript', '-e', _MOUSE_POSITION_SCRIPT], 
+                                   capture_output=True, check=False)
             
             # Check return code
             if result.returncode != 0:
-                logger.warning(f"AppleScript failed with return code {result.returncode}: {result.stderr}")
+                logger.warning(f"AppleScript failed with return code {result.returncode}: {result.stderr.decode(errors='replace')}")
                 return 0, 0
                 
-            if result.stdout:
-                parts = result.stdout.strip().split(', ')
-                if len(parts) == 2:
-                    return int(parts[0]), int(parts[1])
+            match = _POS_RE.match(result.stdout)
+            if match:
+                return int(match[1]), int(match[2])
             return 0, 0
         except Exception as e:
             logger.error(f"Error getting mouse position: {e}")
             return 0, 0
 
+def _native_mouse_position_reader():
+    """
+    Returns a function reading the mouse position through CoreGraphics, or AppKit if Quartz isn't available.
+    Returns None if neither can be imported.
+    """
+    try:
+        import Quartz
+        
+        # the event source is allocated once and reused for every read
+        event_source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateHIDSystemState)
+        
+        def read_quartz():
+            location = Quartz.CGEventGetLocation(Quartz.CGEventCreate(event_source))
+            return int(location.x), int(location.y)
+        
+        return read_quartz
+    except ImportError:
+        pass
+    
+    try:
+        from AppKit import NSEvent, NSScreen
+        
+        def read_appkit():
+            location = NSEvent.mouseLocation()
+            # AppKit puts the origin at the bottom left of the main screen, CoreGraphics at the top left
+            screen_height = NSScreen.screens()[0].frame().size.height
+            return int(location.x), int(screen_height - location.y)
+        
+        return read_appkit
+    except ImportError:
+        logger.info("PyObjC is not available, reading the mouse position with AppleScript")
+        return None
+
+_PYNPUT_PROBE_RESULT: tuple[bool, Exception | None] | None = None
+
+def _probe_pynput_once() -> tuple[bool, Exception | None]:
+    """
+    Starts and stops throwaway pynput listeners to find out whether they work on this system.
+    The probe only runs once, later calls return the cached (works, error) result.
+    """
+    global _PYNPUT_PROBE_RESULT
+    
+    if _PYNPUT_PROBE_RESULT is None:
+        try:
+            test_mouse = mouse.Listener(on_move=lambda x, y: None)
+            test_keyboard = keyboard.Listener(on_press=lambda k: None)
+            for test_listener in (test_mouse, test_keyboard):
+                test_listener.start()
+                # wait() returns as soon as the listener is up, the timeout only matters if it never is
+                waiter = threading.Thread(target=test_listener.wait, daemon=True)
+                waiter.start()
+                waiter.join(timeout=0.1)
+                test_listener.stop()
+            _PYNPUT_PROBE_RESULT = (True, None)
+        except Exception as e:
+            _PYNPUT_PROBE_RESULT = (False, e)
+    
+    return _PYNPUT_PROBE_RESULT
+
+def _is_thread_handle_error(error: Exception | None) -> bool:
+    """Whether the error is pynput's ThreadHandle incompatibility with newer Python versions on macOS."""
+    return isinstance(error, TypeError) and "_ThreadHandle" in str(error) and "not callable" in str(error)
+
 def check_macos_permissions():
     """Check and prompt for permissions on macOS."""
-    if system() != "Darwin":
+    if _PLATFORM != "Darwin":
         return True
     
     # Check for Accessibility permissions
     try:
-        # This command checks if the app has accessibility permissions
-        result = subprocess.run(
-            ["osascript", "-e", 'tell application "System Events"\ntry\nget the position of the mouse\non error\nreturn {0, 0}\nend try\nend tell'],
-            capture_output=True, timeout=1
-        )
+        # Ask the accessibility API directly, this is a single call instead of launching osascript
+        try:
+            from HIServices import AXIsProcessTrusted
+            permissions_granted = bool(AXIsProcessTrusted())
+        except ImportError:
+            # Without PyObjC, this command checks if the app has accessibility permissions
+            result = subprocess.run(
+                ["osascript", "-e", _MOUSE_POSITION_SCRIPT],
+                capture_output=True, timeout=1
+            )
+            permissions_granted = result.returncode == 0
         
-        permissions_granted = True
-        if result.returncode != 0:
+        if not permissions_granted:
             logger.warning("Accessibility permissions not granted")
-            permissions_granted = False
             
             # Show a more detailed explanation about permissions
             QMessageBox.warning(
@@ -147,29 +350,25 @@ def check_macos_permissions():
             )
             return False
             
-        # Try to test pynput specifically to detect the TypeError issue
-        try:
-            logger.info("Testing if pynput has the ThreadHandle issue...")
-            # Create a short-lived test listener
-            test_listener = mouse.Listener(on_move=lambda x, y: None)
-            test_listener.start()
-            time.sleep(0.1)
-            test_listener.stop()
+        # Test pynput specifically to detect the TypeError issue
+        logger.info("Testing if pynput has the ThreadHandle issue...")
+        pynput_works, error = _probe_pynput_once()
+        if pynput_works:
             logger.info("pynput test completed without errors")
             return True
-        except TypeError as e:
-            # Catch the specific TypeError we see in the logs
-            if "_ThreadHandle" in str(e) and "not callable" in str(e):
-                logger.warning(f"Detected pynput ThreadHandle error: {e}")
-                QMessageBox.information(
-                    None,
-                    "Input Capture Limitation",
-                    "DuckTrack has detected a compatibility issue with input capture on your version of macOS.\n\n"
-                    "We'll still record your screen, but detailed input events won't be captured.\n\n"
-                    "This is a known limitation with the input library on newer macOS versions."
-                )
-                return False
-            raise  # Re-raise if it's a different TypeError
+        
+        # Catch the specific TypeError we see in the logs
+        if _is_thread_handle_error(error):
+            logger.warning(f"Detected pynput ThreadHandle error: {error}")
+            QMessageBox.information(
+                None,
+                "Input Capture Limitation",
+                "DuckTrack has detected a compatibility issue with input capture on your version of macOS.\n\n"
+                "We'll still record your screen, but detailed input events won't be captured.\n\n"
+                "This is a known limitation with the input library on newer macOS versions."
+            )
+            return False
+        raise error  # Re-raise if it's a different error
         
     except Exception as e:
         logger.error(f"Error checking permissions: {e}")
@@ -191,76 +390,116 @@ class Recorder(QThread):
     
     recording_stopped = pyqtSignal()
 
+    STOP_TIMEOUT_MS = 3000
+    
+    # at most this many queued events are serialized into a single write
+    WRITE_BATCH_SIZE = 256
+    # the writer holds serialized events until this many bytes are buffered...
+    WRITE_FLUSH_BYTES = 1 << 20
+    # ...or the oldest of them has waited this many seconds
+    WRITE_FLUSH_INTERVAL = 1.0
+    # how often the recording thread logs that it is still alive, in seconds
+    HEARTBEAT_INTERVAL = 10
+    # how long the events file may go without a write before a sentinel is added, in seconds
+    SENTINEL_INTERVAL = 2.0
+    # mouse moves arriving within this many seconds of the last recorded one are coalesced
+    MOVE_COALESCE_INTERVAL = 0.008
+    # whether stop_recording waits for the recording files to be synced to disk before reporting the recording stopped,
+    # Windows can't rename the recording directory while the sync thread still has a file open in it
+    WAIT_FOR_SYNC = _PLATFORM == "Windows"
+
     def __init__(self, natural_scrolling: bool):
         super().__init__()
         
-        if system() == "Windows":
+        if _PLATFORM == "Windows":
             fix_windows_dpi_scaling()
         
         # Check permissions on macOS and detect pynput compatibility issues
         self.use_fallback = False
         self.thread_handle_error_detected = False
         
-        if system() == "Darwin":
-            # Try a quick test of pynput to catch the ThreadHandle error before proceeding
-            try:
-                test_listener = mouse.Listener(on_move=lambda x, y: None)
-                test_listener.start()
-                time.sleep(0.1)  # Give it a moment to fail if it's going to
-                test_listener.stop()
-                logger.info("Initial pynput test passed")
+        if _PLATFORM == "Darwin":
+            # Test pynput to catch the ThreadHandle error before proceeding
+            pynput_works, error = _probe_pynput_once()
+            if _is_thread_handle_error(error):
+                logger.error(f"Detected pynput ThreadHandle compatibility issue: {error}")
+                self.thread_handle_error_detected = True
+                self.use_fallback = True
+                
+                # Inform the user about the limitation
+                QMessageBox.information(
+                    None,
+                    "Input Capture Limitation",
+                    "DuckTrack has detected a compatibility issue with input capture on your version of macOS.\n\n"
+                    "We'll still record your screen, but detailed input events won't be captured.\n\n"
+                    "This is a known limitation with the input library on newer macOS versions."
+                )
+            else:
+                if pynput_works:
+                    logger.info("Initial pynput test passed")
+                else:
+                    logger.warning(f"Error in pynput test: {error}")
                 
                 # Continue with normal permission check
                 has_permissions = check_macos_permissions()
                 if not has_permissions:
                     logger.warning("Missing required permissions for event recording")
                     self.use_fallback = True
-            except TypeError as e:
-                # Check specifically for the ThreadHandle error
-                if "_ThreadHandle" in str(e) and "not callable" in str(e):
-                    logger.error(f"Detected pynput ThreadHandle compatibility issue: {e}")
-                    self.thread_handle_error_detected = True
-                    self.use_fallback = True
-                    
-                    # Inform the user about the limitation
-                    QMessageBox.information(
-                        None,
-                        "Input Capture Limitation",
-                        "DuckTrack has detected a compatibility issue with input capture on your version of macOS.\n\n"
-                        "We'll still record your screen, but detailed input events won't be captured.\n\n"
-                        "This is a known limitation with the input library on newer macOS versions."
-                    )
-                else:
-                    # If it's a different TypeError, still do the permission check
-                    logger.warning(f"Unknown TypeError during pynput test: {e}")
-                    has_permissions = check_macos_permissions()
-                    if not has_permissions:
-                        self.use_fallback = True
-            except Exception as e:
-                logger.warning(f"Error in pynput test: {e}")
-                # Still try the permission check
-                has_permissions = check_macos_permissions()
-                if not has_permissions:
-                    self.use_fallback = True
         
         self.recording_path = self._get_recording_path()
         
         self._is_recording = False
         self._is_paused = False
+        self._stopped_emitted = False
         
-        self.event_queue = Queue()
-        self.events_file = open(os.path.join(self.recording_path, "events.jsonl"), "a")
+        # deque appends and pops are atomic, so the input callbacks hand events over without a queue lock,
+        # _wake just tells run() there is something to pick up
+        self.event_queue = deque()
+        self._wake = threading.Event()
+        # bound once so the input callbacks skip the attribute lookups on every event
+        self._perf_counter = time.perf_counter
+        self._move_counter = 0
         
-        self.metadata_manager = MetadataManager(
-            recording_path=self.recording_path, 
-            natural_scrolling=natural_scrolling
-        )
-        self.obs_client = OBSClient(recording_path=self.recording_path, 
-                                    metadata=self.metadata_manager.metadata)
+        # mouse moves closer together than MOVE_COALESCE_INTERVAL are collapsed into the latest one,
+        # this happens in run() so the input callbacks never have to take a lock
+        self._last_move_ts = 0.0
+        self._pending_move = None
+        
+        # the writer thread owns the events file, run() only hands it serialized batches through the write queue
+        # SimpleQueue is implemented in C and skips the maxsize and task_done bookkeeping Queue does on every put
+        self.write_queue = SimpleQueue()
+        self.writer_thread = threading.Thread(target=self._write_events, name="DuckTrack events writer", daemon=True)
+        # fsync can take a long time on slow disks, so the finished files are synced by their own thread
+        # which stop_recording only waits on for a bounded time
+        self.sync_queue = SimpleQueue()
+        self.sync_thread = threading.Thread(target=self._sync_files, name="DuckTrack file sync", daemon=True)
+        
+        # If connecting to OBS or collecting the metadata fails, the recording never starts and stop_recording never runs,
+        # so the events fd is closed here instead of leaking
+        with ExitStack() as cleanup:
+            # whole lines are appended straight to the fd, the writer does its own buffering instead of a file object
+            self.events_fd = os.open(os.path.join(self.recording_path, "events.jsonl"), 
+                                     os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+            cleanup.callback(os.close, self.events_fd)
+            
+            self.metadata_manager = MetadataManager(
+                recording_path=self.recording_path, 
+                natural_scrolling=natural_scrolling
+            )
+            self.obs_client = OBSClient(recording_path=self.recording_path, 
+                                        metadata=self.metadata_manager.metadata)
+            
+            # From here on the sync thread closes the fd once the recording stops
+            cleanup.pop_all()
 
+        # The input sources, whichever ones aren't used stay None
+        self.mouse_listener = None
+        self.keyboard_listener = None
+        self.macos_monitor = None
+        
         # Create listeners with try/except to catch permission issues
         try:
-            if system() == "Darwin" and (self.use_fallback or self.thread_handle_error_detected):
+            if _PLATFORM == "Darwin" and (self.use_fallback or self.thread_handle_error_detected):
                 # Use the fallback method on macOS if we need to
                 if self.thread_handle_error_detected:
                     logger.info("Using macOS fallback input monitor due to pynput compatibility issue")
@@ -287,20 +526,13 @@ class Recorder(QThread):
                     on_release=self.on_release)
                 
                 logger.info("Testing listeners...")
-                try:
-                    test_mouse = mouse.Listener(on_move=lambda x, y: None)
-                    test_mouse.start()
-                    test_mouse.stop()
-                    
-                    test_keyboard = keyboard.Listener(on_press=lambda k: None)
-                    test_keyboard.start()
-                    test_keyboard.stop()
-                    
+                pynput_works, error = _probe_pynput_once()
+                if pynput_works:
                     logger.info("Input listeners successfully initialized")
-                except TypeError as e:
+                else:
                     # If we get the ThreadHandle error during testing, switch to fallback
-                    if "_ThreadHandle" in str(e) and "not callable" in str(e):
-                        logger.error(f"Cannot use standard listeners due to error: {e}")
+                    if _is_thread_handle_error(error):
+                        logger.error(f"Cannot use standard listeners due to error: {error}")
                         self.thread_handle_error_detected = True
                         self.use_fallback = True
                         
@@ -311,11 +543,11 @@ class Recorder(QThread):
                         self.mouse_listener = None
                         self.keyboard_listener = None
                     else:
-                        raise
+                        raise error
         except Exception as e:
             logger.error(f"ERROR initializing input listeners: {e}")
             # Switch to fallback method on macOS
-            if system() == "Darwin":
+            if _PLATFORM == "Darwin":
                 logger.info("Switching to macOS fallback input monitor due to error")
                 self.macos_monitor = MacOSInputMonitor(
                     on_click=self.macos_on_input
@@ -374,113 +606,188 @@ class Recorder(QThread):
                     }
                     logger.info(f"MacOS fallback event: {event_type} at ({x}, {y})")
                 
-                self.event_queue.put(event, block=False)
+                self._queue_put(event)
             except Exception as e:
                 logger.error(f"Error in macOS fallback input handler: {e}")
     
     def on_move(self, x, y):
         if not self._is_paused and self._is_recording:
             try:
-                # Debug every nth move event to avoid too much output
-                if not hasattr(self, '_move_counter'):
-                    self._move_counter = 0
+                event = (self._perf_counter(), "move", x, y)
+                self._queue_put(event)
                 
+                # Debug every nth move event to avoid too much output
                 self._move_counter += 1
                 if self._move_counter % 100 == 0:  # Only log every 100th move event
                     logger.info(f"Mouse moved to ({x}, {y})")
-                
-                event = {"time_stamp": time.perf_counter(), 
-                        "action": "move", 
-                        "x": x, 
-                        "y": y}
-                self.event_queue.put(event, block=False)
             except Exception as e:
                 logger.error(f"Error capturing mouse move: {e}")
         
     def on_click(self, x, y, button, pressed):
         if not self._is_paused and self._is_recording:
             try:
-                # Print debug info for mouse clicks with timestamp
-                logger.info(f"[{time.strftime('%H:%M:%S')}] Mouse click: x={x}, y={y}, button={button.name}, pressed={pressed}")
+                button_name = _BUTTON_NAMES.get(button) or _BUTTON_NAMES.setdefault(button, button.name)
+                
+                # Print debug info for mouse clicks, only formatted when debug logging is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Mouse click: x=%s, y=%s, button=%s, pressed=%s", x, y, button_name, pressed)
                 
-                event = {"time_stamp": time.perf_counter(), 
-                        "action": "click", 
-                        "x": x, 
-                        "y": y, 
-                        "button": button.name, 
-                        "pressed": pressed}
-                self.event_queue.put(event, block=False)
+                event = (self._perf_counter(), "click", x, y, button_name, pressed)
+                self._queue_put(event)
             except Exception as e:
                 logger.error(f"Error capturing mouse click: {e}")
     
     def on_scroll(self, x, y, dx, dy):
         if not self._is_paused and self._is_recording:
             try:
-                event = {"time_stamp": time.perf_counter(), 
-                        "action": "scroll", 
-                        "x": x, 
-                        "y": y, 
-                        "dx": dx, 
-                        "dy": dy}
-                self.event_queue.put(event, block=False)
+                event = (self._perf_counter(), "scroll", x, y, dx, dy)
+                self._queue_put(event)
             except Exception as e:
                 logger.error(f"Error capturing scroll: {e}")
     
     def on_press(self, key):
         if not self._is_paused and self._is_recording:
             try:
-                key_name = key.char if hasattr(key, 'char') and key.char is not None else key.name
-                # Print debug info for key presses with timestamp
-                logger.info(f"[{time.strftime('%H:%M:%S')}] Key press: {key_name}")
+                char = getattr(key, 'char', None)
+                key_name = char if char is not None else key.name
+                # Print debug info for key presses, only formatted when debug logging is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Key press: %s", key_name)
                 
-                event = {"time_stamp": time.perf_counter(), 
-                        "action": "press", 
-                        "name": key_name}
-                self.event_queue.put(event, block=False)
+                event = (self._perf_counter(), "press", key_name)
+                self._queue_put(event)
             except Exception as e:
                 logger.error(f"Error capturing key press: {e}")
 
     def on_release(self, key):
         if not self._is_paused and self._is_recording:
             try:
-                key_name = key.char if hasattr(key, 'char') and key.char is not None else key.name
+                char = getattr(key, 'char', None)
+                key_name = char if char is not None else key.name
                 
-                event = {"time_stamp": time.perf_counter(), 
-                        "action": "release", 
-                        "name": key_name}
-                self.event_queue.put(event, block=False)
+                event = (self._perf_counter(), "release", key_name)
+                self._queue_put(event)
             except Exception as e:
                 logger.error(f"Error capturing key release: {e}")
 
+    def _queue_put(self, event: dict | tuple):
+        self.event_queue.append(event)
+        # set() takes the Event's lock, it is only needed when run() may be waiting
+        if not self._wake.is_set():
+            self._wake.set()
+
+    def _take_events(self, limit: int | None = None) -> list[bytes]:
+        """
+        Takes events off the event queue and serializes them, coalescing mouse moves on the way.
+        A move within MOVE_COALESCE_INTERVAL of the last written one is held back, and replaced by any newer move,
+        until the window is over or another event comes along.
+        """
+        batch = []
+        while self.event_queue and (limit is None or len(batch) < limit):
+            event = self.event_queue.popleft()
+            
+            if type(event) is tuple and event[1] == "move":
+                if event[0] - self._last_move_ts < self.MOVE_COALESCE_INTERVAL:
+                    self._pending_move = event
+                    continue
+                self._pending_move = None
+                self._last_move_ts = event[0]
+            elif self._pending_move is not None:
+                # the held back move happened first, so it has to be written first
+                batch.append(self._take_pending_move())
+            
+            batch.append(_event_line(event))
+        return batch
+
+    def _take_pending_move(self) -> bytes:
+        """Serializes the held back mouse move, which then counts as the last written one."""
+        move, self._pending_move = self._pending_move, None
+        self._last_move_ts = move[0]
+        return _event_line(move)
+
+    def _write_event(self, event: dict):
+        self.write_queue.put(_dumps_line(event))
+
+    def _write_events(self):
+        """
+        Writes serialized batches from the write queue to the events file until it receives None.
+        Batches are held until WRITE_FLUSH_BYTES have piled up or the oldest one has waited WRITE_FLUSH_INTERVAL,
+        so a busy recording goes out in a few large writes instead of one per batch.
+        """
+        pending = []
+        pending_bytes = 0
+        flush_at = None
+        done = False
+        
+        while not done:
+            try:
+                timeout = None if flush_at is None else max(0.0, flush_at - time.monotonic())
+                chunk = self.write_queue.get(timeout=timeout)
+                
+                # Take everything else that is already queued along with it
+                while chunk is not None:
+                    pending.append(chunk)
+                    pending_bytes += len(chunk)
+                    chunk = self.write_queue.get_nowait()
+                done = True
+            except Empty:
+                pass
+            
+            if not pending:
+                continue
+            if flush_at is None:
+                flush_at = time.monotonic() + self.WRITE_FLUSH_INTERVAL
+            
+            if done or pending_bytes >= self.WRITE_FLUSH_BYTES or time.monotonic() >= flush_at:
+                try:
+                    _write_all(self.events_fd, pending)
+                except Exception as e:
+                    logger.error(f"Error writing events: {e}")
+                pending = []
+                pending_bytes = 0
+                flush_at = None
+
+    def _sync_files(self):
+        """Fsyncs and closes the fds from the sync queue until it receives None."""
+        # The fds are handed over still open, the app may rename the recording directory
+        # before they are synced, and only a path would need to be opened again
+        while (fd := self.sync_queue.get()) is not None:
+            try:
+                _sync_fd(fd)
+            except Exception as e:
+                logger.error(f"Error syncing recording file: {e}")
+            finally:
+                os.close(fd)
+
     def run(self):
         self._is_recording = True
+        self.writer_thread.start()
+        self.sync_thread.start()
         
         self.metadata_manager.collect()
         self.obs_client.start_recording()
         
         # Add a startup event for debugging
         start_event = {"time_stamp": time.perf_counter(), "action": "recording_started"}
-        self.events_file.write(json.dumps(start_event) + "\n")
-        self.events_file.flush()  # Ensure it's written to disk immediately
+        self._write_event(start_event)
         
         logger.info(f"Starting recording to {self.recording_path}")
         
         # Determine which input capture method we're using
         capture_method = "unknown"
-        if system() == "Darwin" and (self.use_fallback or self.thread_handle_error_detected):
+        if _PLATFORM == "Darwin" and (self.use_fallback or self.thread_handle_error_detected):
             if self.thread_handle_error_detected:
                 capture_method = "macOS_fallback_due_to_pynput_error"
             else:
                 capture_method = "macOS_fallback_due_to_permissions"
-        elif hasattr(self, 'mouse_listener') and hasattr(self, 'keyboard_listener') and self.mouse_listener and self.keyboard_listener:
+        elif self.mouse_listener is not None and self.keyboard_listener is not None:
             capture_method = "pynput_listeners"
         else:
             capture_method = "none"
         
         # Add event for the capture method
         method_event = {"time_stamp": time.perf_counter(), "action": "input_capture_method", "method": capture_method}
-        self.events_file.write(json.dumps(method_event) + "\n")
-        self.events_file.flush()
+        self._write_event(method_event)
         
         # Check if listeners are defined and start them
         listeners_working = False  # Default to assuming not working
@@ -492,8 +799,7 @@ class Recorder(QThread):
                 
                 # Add an event to show fallback method is being used
                 fallback_event = {"time_stamp": time.perf_counter(), "action": "macos_fallback_monitor_started", "reason": capture_method}
-                self.events_file.write(json.dumps(fallback_event) + "\n")
-                self.events_file.flush()
+                self._write_event(fallback_event)
                 listeners_working = True  # The fallback monitor should work
             elif capture_method == "pynput_listeners":
                 try:
@@ -514,14 +820,13 @@ class Recorder(QThread):
                                     "action": "input_listeners_started",
                                     "mouse_running": self.mouse_listener.running,
                                     "keyboard_running": self.keyboard_listener.running}
-                    self.events_file.write(json.dumps(listener_event) + "\n")
-                    self.events_file.flush()
+                    self._write_event(listener_event)
                 except TypeError as e:
                     # If we get the ThreadHandle error at this stage, try to recover
-                    if "_ThreadHandle" in str(e) and "not callable" in str(e):
+                    if _is_thread_handle_error(e):
                         logger.error(f"pynput ThreadHandle error when starting listeners: {e}")
                         # Switch to fallback if we're on macOS
-                        if system() == "Darwin" and not hasattr(self, 'macos_monitor'):
+                        if _PLATFORM == "Darwin" and self.macos_monitor is None:
                             logger.info("Creating fallback monitor after pynput failure")
                             self.macos_monitor = MacOSInputMonitor(
                                 on_click=self.macos_on_input
@@ -533,8 +838,7 @@ class Recorder(QThread):
                             recovery_event = {"time_stamp": time.perf_counter(), 
                                             "action": "recovered_with_fallback_monitor", 
                                             "error": str(e)}
-                            self.events_file.write(json.dumps(recovery_event) + "\n")
-                            self.events_file.flush()
+                            self._write_event(recovery_event)
                     else:
                         # Different error
                         logger.error(f"Error starting pynput listeners: {e}")
@@ -545,8 +849,7 @@ class Recorder(QThread):
                 
                 # Add an event to show listeners are not available
                 no_listener_event = {"time_stamp": time.perf_counter(), "action": "input_listeners_unavailable"}
-                self.events_file.write(json.dumps(no_listener_event) + "\n")
-                self.events_file.flush()
+                self._write_event(no_listener_event)
             
             # Log that recording has started and inputs are being captured
             heartbeat_event = {"time_stamp": time.perf_counter(), 
@@ -554,151 +857,256 @@ class Recorder(QThread):
                              "message": "Recording active", 
                              "capture_method": capture_method,
                              "listeners_working": listeners_working}
-            self.events_file.write(json.dumps(heartbeat_event) + "\n")
-            self.events_file.flush()
+            self._write_event(heartbeat_event)
 
-            # Periodically add sentinel events to the events file to ensure it's not empty
-            last_sentinel_time = time.time()
-            last_file_write_time = time.time()
-            events_count = 0
+            # Main event processing loop, specialized for the capture method
+            if capture_method.startswith("macOS_fallback"):
+                self._run_fallback(capture_method)
+            else:
+                self._run_pynput(capture_method)
             
-            # Main event processing loop
-            while self._is_recording:
-                current_time = time.time()
-                try:
-                    # Check if we need to write a sentinel directly to the file
-                    # This is our backup to ensure the file is never empty
-                    if current_time - last_file_write_time > 5:
-                        logger.info("Direct sentinel: ensuring events file has content")
-                        direct_sentinel = {
-                            "time_stamp": time.perf_counter(), 
-                            "action": "direct_sentinel", 
-                            "timestamp": current_time
-                        }
-                        self.events_file.write(json.dumps(direct_sentinel) + "\n")
-                        self.events_file.flush()
-                        last_file_write_time = current_time
-                    
-                    # Process events from the queue with a short timeout
-                    try:
-                        event = self.event_queue.get(timeout=0.5)  # Shorter timeout for more frequent checks
-                        self.events_file.write(json.dumps(event) + "\n")
-                        self.events_file.flush()  # Flush after each event to ensure it's written
-                        events_count += 1
-                        last_file_write_time = current_time  # Update last write time
-                    except Empty:
-                        # No events in the queue, check if we need to add a sentinel
-                        if current_time - last_sentinel_time > 2:
-                            sentinel_event = {
-                                "time_stamp": time.perf_counter(), 
-                                "action": "sentinel", 
-                                "timestamp": current_time
-                            }
-                            self.event_queue.put(sentinel_event, block=False)
-                            last_sentinel_time = current_time
-                    
-                    # Log heartbeat periodically
-                    if time.time() % 10 < 0.1:
-                        if not hasattr(self, '_last_heartbeat') or time.time() - self._last_heartbeat > 10:
-                            logger.info(f"Heartbeat: Input monitoring ({capture_method}) is running. Events recorded: {events_count}")
-                            self._last_heartbeat = time.time()
-                            
-                except Exception as e:
-                    logger.error(f"Error processing event: {e}")
-                    time.sleep(0.1)  # Brief sleep on error
+            # Drain whatever was queued before the listeners were stopped
+            batch = self._take_events()
+            if self._pending_move is not None:
+                batch.append(self._take_pending_move())
+            self.write_queue.put(b"".join(batch))
         except Exception as e:
             logger.error(f"Error in recording thread: {e}")
         
         # Add a final event
         end_event = {"time_stamp": time.perf_counter(), "action": "recording_ended"}
         try:
-            self.events_file.write(json.dumps(end_event) + "\n")
-            self.events_file.flush()
+            self._write_event(end_event)
         except Exception as e:
             logger.error(f"Error writing final event: {e}")
 
+    def _run_pynput(self, capture_method: str):
+        """Event loop for the pynput listeners, adding a sentinel whenever nothing was written for a while."""
+        next_sentinel = time.monotonic() + self.SENTINEL_INTERVAL
+        next_heartbeat = time.monotonic() + self.HEARTBEAT_INTERVAL
+        events_count = 0
+        
+        event_queue = self.event_queue
+        wait, clear = self._wake.wait, self._wake.clear
+        take_batch = self._take_batch
+        put_batch = self.write_queue.put
+        
+        while self._is_recording:
+            try:
+                # Wait for events with a short timeout, clearing the wake flag before looking at the queue
+                # so an event appended after the check sets it again
+                if not event_queue:
+                    wait(timeout=0.5)  # Shorter timeout for more frequent checks
+                clear()
+                now = time.monotonic()
+                
+                # Grab everything that is already queued so it all goes out in one write
+                batch = take_batch()
+                if batch:
+                    put_batch(b"".join(batch))
+                    events_count += len(batch)
+                    next_sentinel = now + self.SENTINEL_INTERVAL
+                elif now >= next_sentinel:
+                    # Nothing was written for a while, add a sentinel so the events file shows the recording is alive
+                    sentinel_event = {
+                        "time_stamp": time.perf_counter(), 
+                        "action": "sentinel", 
+                        "timestamp": time.time()
+                    }
+                    self._queue_put(sentinel_event)
+                    next_sentinel = now + self.SENTINEL_INTERVAL
+                
+                # Log heartbeat periodically
+                if now >= next_heartbeat:
+                    logger.info(f"Heartbeat: Input monitoring ({capture_method}) is running. Events recorded: {events_count}")
+                    next_heartbeat = now + self.HEARTBEAT_INTERVAL
+                
+            except Exception as e:
+                logger.error(f"Error processing event: {e}")
+                time.sleep(0.1)  # Brief sleep on error
+
+    def _run_fallback(self, capture_method: str):
+        """Event loop for the macOS fallback monitor, which already adds its own sentinels."""
+        next_heartbeat = time.monotonic() + self.HEARTBEAT_INTERVAL
+        events_count = 0
+        
+        event_queue = self.event_queue
+        wait, clear = self._wake.wait, self._wake.clear
+        take_batch = self._take_batch
+        put_batch = self.write_queue.put
+        
+        while self._is_recording:
+            try:
+                # Wait for events with a short timeout, clearing the wake flag before looking at the queue
+                # so an event appended after the check sets it again
+                if not event_queue:
+                    wait(timeout=0.5)  # Shorter timeout for more frequent checks
+                clear()
+                now = time.monotonic()
+                
+                batch = take_batch()
+                if batch:
+                    put_batch(b"".join(batch))
+                    events_count += len(batch)
+                
+                # Log heartbeat periodically
+                if now >= next_heartbeat:
+                    logger.info(f"Heartbeat: Input monitoring ({capture_method}) is running. Events recorded: {events_count}")
+                    next_heartbeat = now + self.HEARTBEAT_INTERVAL
+                
+            except Exception as e:
+                logger.error(f"Error processing event: {e}")
+                time.sleep(0.1)  # Brief sleep on error
+
+    def _take_batch(self) -> list[bytes]:
+        """Takes the next batch to write, including a held back mouse move whose coalescing window is over."""
+        batch = self._take_events(self.WRITE_BATCH_SIZE)
+        if (self._pending_move is not None and 
+                self._perf_counter() - self._last_move_ts >= self.MOVE_COALESCE_INTERVAL):
+            batch.append(self._take_pending_move())
+        return batch
+
     def stop_recording(self):
         if self._is_recording:
             logger.info("Stopping recording...")
             self._is_recording = False
 
             try:
-                # Add a small delay to ensure pending events are processed
-                time.sleep(0.5)
-                
-                # Clean shutdown of event listeners if they exist
-                logger.info("Stopping event listeners...")
-                try:
-                    if system() == "Darwin" and self.use_fallback and hasattr(self, 'macos_monitor'):
-                        # Stop the macOS fallback monitor
-                        self.macos_monitor.stop()
-                    else:
-                        if hasattr(self, 'mouse_listener') and self.mouse_listener and self.mouse_listener.running:
-                            self.mouse_listener.stop()
-                        if hasattr(self, 'keyboard_listener') and self.keyboard_listener and self.keyboard_listener.running:
-                            self.keyboard_listener.stop()
-                except Exception as e:
-                    logger.error(f"Error stopping listeners: {e}")
+                # How long each shutdown phase took, logged once at the end instead of a line per phase
+                phases: dict[str, float] = {}
                 
-                # Finalize metadata
-                logger.info("Finalizing metadata...")
-                try:
-                    self.metadata_manager.end_collect()
-                except Exception as e:
-                    logger.error(f"Error finalizing metadata: {e}")
-                
-                # Stop OBS recording
-                logger.info("Stopping OBS recording...")
-                try:
-                    self.obs_client.stop_recording()
-                    self.metadata_manager.add_obs_record_state_timings(self.obs_client.record_state_events)
-                except Exception as e:
-                    logger.error(f"Error stopping OBS recording: {e}")
+                # Stopping OBS is a round trip to its websocket, so it runs while the other phases do
+                self._obs_stop_error = None
+                self.obs_stop_thread = threading.Thread(target=self._stop_obs, args=(phases,), 
+                                                        name="DuckTrack OBS stop", daemon=True)
+                self.obs_stop_thread.start()
                 
-                # Close and flush events file
-                logger.info("Closing events file...")
-                try:
-                    self.events_file.flush()
-                    self.events_file.close()
-                except Exception as e:
-                    logger.error(f"Error closing events file: {e}")
+                # (phase, what it does for error messages, step), in the order they have to run
+                steps = (
+                    ("listeners", "stopping listeners", self._stop_listeners),
+                    ("drain", "draining events", self._drain_events),
+                    ("finalize_metadata", "finalizing metadata", self.metadata_manager.end_collect),
+                    # The writer already wrote out everything it buffered when it got None,
+                    # so the sync thread can fsync and close the events fd without reopening the file
+                    ("close_events", "closing events file", lambda: self.sync_queue.put(self.events_fd)),
+                    # The OBS record state timings go into the metadata, so it can only be saved once OBS has stopped
+                    ("wait_obs", "stopping OBS recording", self._wait_for_obs_stop),
+                    ("save_metadata", "saving metadata", self._save_metadata),
+                    ("sync", "syncing recording files", self._finish_sync),
+                )
                 
-                # Save metadata
-                logger.info("Saving metadata...")
-                try:
-                    self.metadata_manager.save_metadata()
-                except Exception as e:
-                    logger.error(f"Error saving metadata: {e}")
+                for phase, description, step in steps:
+                    start = time.perf_counter()
+                    try:
+                        step()
+                    except Exception as e:
+                        logger.error(f"Error {description}: {e}")
+                    phases[phase] = time.perf_counter() - start
                 
-                logger.info(f"Recording stopped and saved to {self.recording_path}")
-                self.recording_stopped.emit()
+                if logger.isEnabledFor(logging.INFO):
+                    timings = ", ".join(f"{name} {duration * 1000:.1f} ms" for name, duration in phases.items())
+                    logger.info("Recording stopped and saved to %s (%s)", self.recording_path, timings, 
+                                extra={"phases": phases})
+                self._emit_stopped_once()
             except Exception as e:
                 logger.error(f"Error during recording shutdown: {e}")
-                self.recording_stopped.emit()
+                self._emit_stopped_once()
+    
+    def _emit_stopped_once(self):
+        # flagged before emitting, so a slot that raises isn't called a second time from the error path
+        if not self._stopped_emitted:
+            self._stopped_emitted = True
+            self.recording_stopped.emit()
+    
+    def _stop_listeners(self):
+        """Clean shutdown of the event listeners if they exist."""
+        if self.macos_monitor is not None:
+            # Stop the macOS fallback monitor
+            self.macos_monitor.stop()
+        else:
+            if self.mouse_listener is not None and self.mouse_listener.running:
+                self.mouse_listener.stop()
+            if self.keyboard_listener is not None and self.keyboard_listener.running:
+                self.keyboard_listener.stop()
+    
+    def _drain_events(self):
+        """Waits for run() and the writer to get every queued event into the events file."""
+        # Wake run() up so it notices right away that recording stopped
+        self._wake.set()
+        
+        # Let run() drain the queue and write its final event before the file is closed
+        if self.isRunning() and not self.wait(self.STOP_TIMEOUT_MS):
+            logger.warning("Recording thread did not finish draining events in time")
+        
+        # Let the writer finish everything queued before the file is closed
+        if self.writer_thread.is_alive():
+            self.write_queue.put(None)
+            self.writer_thread.join(timeout=self.STOP_TIMEOUT_MS / 1000)
+    
+    def _stop_obs(self, phases: dict[str, float]):
+        """Stops the OBS recording, adding how long it took to phases as "obs"."""
+        start = time.perf_counter()
+        try:
+            self.obs_client.stop_recording()
+        except Exception as e:
+            # raised again by _wait_for_obs_stop, so it is reported like any other failed phase
+            self._obs_stop_error = e
+        phases["obs"] = time.perf_counter() - start
+    
+    def _wait_for_obs_stop(self):
+        self.obs_stop_thread.join(timeout=self.STOP_TIMEOUT_MS / 1000)
+        if self.obs_stop_thread.is_alive():
+            raise TimeoutError("OBS did not stop the recording in time")
+        if self._obs_stop_error is not None:
+            raise self._obs_stop_error
+        # only once OBS has stopped, so the metadata is never touched by two threads at a time
+        self.metadata_manager.add_obs_record_state_timings(self.obs_client.record_state_events)
+    
+    def _save_metadata(self):
+        fd = self.metadata_manager.open_metadata_file()
+        try:
+            self.metadata_manager.write_metadata(fd)
+        except BaseException:
+            os.close(fd)
+            raise
+        self.sync_queue.put(fd)
+    
+    def _finish_sync(self):
+        # The sync thread finishes on its own, waiting for the files to reach the disk is optional
+        self.sync_queue.put(None)
+        if self.WAIT_FOR_SYNC:
+            self.wait_for_sync()
+    
+    def wait_for_sync(self) -> bool:
+        """
+        Waits for the recording files to be synced to disk after stop_recording, for at most STOP_TIMEOUT_MS
+        so a stuck sync can't hold up the UI for long. Returns whether the sync finished.
+        """
+        if self.sync_thread.is_alive():
+            self.sync_thread.join(timeout=self.STOP_TIMEOUT_MS / 1000)
+            if self.sync_thread.is_alive():
+                logger.warning("Recording files were not synced to disk in time")
+                return False
+        return True
     
     def pause_recording(self):
         if not self._is_paused and self._is_recording:
             self._is_paused = True
             self.obs_client.pause_recording()
-            self.event_queue.put({"time_stamp": time.perf_counter(),
-                                  "action": "pause"}, block=False)
+            self._queue_put((self._perf_counter(), "pause"))
 
     def resume_recording(self):
         if self._is_paused and self._is_recording:
             self._is_paused = False
             self.obs_client.resume_recording()
-            self.event_queue.put({"time_stamp": time.perf_counter(),
-                                  "action": "resume"}, block=False)
+            self._queue_put((self._perf_counter(), "resume"))
 
     def _get_recording_path(self) -> str:
         recordings_dir = get_recordings_dir()
+        os.makedirs(recordings_dir, exist_ok=True)
 
-        if not os.path.exists(recordings_dir):
-            os.mkdir(recordings_dir)
-
-        current_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        
-        recording_path = os.path.join(recordings_dir, f"recording-{current_time}")
+        # the timestamp is appended to the joined prefix, there's no need to format the directory name separately
+        recording_path = os.path.join(recordings_dir, "recording-") + time.strftime("%Y-%m-%d_%H-%M-%S")
         os.mkdir(recording_path)
 
         return recording_path
\ No newline at end of file
@@ -0,0 +1,6 @@
+import os
+
+# The tests never touch real input devices or windows, so they run without a display:
+# pynput's dummy backend and Qt's offscreen platform are picked before ducktrack imports them
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+from ducktrack.app import LogReader
+
+
+class _Reader:
+    """
+    Runs LogReader's read loop without starting a QThread, collecting the emitted chunks.
+    The chunk size is tiny so multi-byte characters get split across reads.
+    """
+
+    CHUNK_SIZE = 3
+    TAIL_SIZE = LogReader.TAIL_SIZE
+
+    run = LogReader.run
+
+    def __init__(self, path, offset=None):
+        self.path = path
+        self.offset = offset
+        self.chunks = []
+        self.chunk_read = SimpleNamespace(emit=self.chunks.append)
+
+    def isInterruptionRequested(self) -> bool:
+        return False
+
+    def read(self) -> str:
+        self.chunks.clear()
+        self.run()
+        return "".join(self.chunks)
+
+
+def test_reads_multi_byte_characters_split_across_chunks(tmp_path):
+    log = tmp_path / "ducktrack.log"
+    log.write_text("héllo wörld ✓\n", encoding="utf-8")
+
+    assert _Reader(log).read() == "héllo wörld ✓\n"
+
+
+def test_refresh_only_reads_what_was_appended(tmp_path):
+    log = tmp_path / "ducktrack.log"
+    log.write_text("first\n", encoding="utf-8")
+    reader = _Reader(log)
+    reader.read()
+
+    with open(log, "a", encoding="utf-8") as f:
+        f.write("second\n")
+
+    assert reader.read() == "second\n"
+
+
+def test_incomplete_trailing_character_is_read_on_the_next_refresh(tmp_path):
+    log = tmp_path / "ducktrack.log"
+    check_mark = "✓".encode("utf-8")
+    log.write_bytes(b"done " + check_mark[:2])
+    reader = _Reader(log)
+
+    assert reader.read() == "done "
+    assert reader.offset == len(b"done ")
+
+    with open(log, "ab") as f:
+        f.write(check_mark[2:] + b"\n")
+
+    assert reader.read() == "✓\n"
+
+
+def test_first_read_starts_at_a_line_in_the_tail(tmp_path):
+    log = tmp_path / "ducktrack.log"
+    log.write_text("old line\nnew line\n", encoding="utf-8")
+    reader = _Reader(log)
+    reader.TAIL_SIZE = len("ine\nnew line\n")
+
+    assert reader.read() == "new line\n"
+
+
+def test_truncated_log_is_read_from_the_tail_again(tmp_path):
+    log = tmp_path / "ducktrack.log"
+    log.write_text("a long first line\n", encoding="utf-8")
+    reader = _Reader(log)
+    reader.read()
+
+    log.write_text("short\n", encoding="utf-8")
+
+    assert reader.read() == "short\n"
@@ -0,0 +1,118 @@
+import socket
+from types import SimpleNamespace
+
+import pytest
+
+from ducktrack import obs_client
+from ducktrack.obs_client import OBSClient, _get_bitrate_kbps_quantized, _scale_resolution
+
+
+def _old_bitrate_kbps(width: int, height: int, fps: int) -> int:
+    """The Mbps table, linear model and rounding _get_bitrate_kbps_quantized replaced."""
+    resolutions = {
+        (7680, 4320): {30: 120, 60: 180},
+        (3840, 2160): {30: 40,  60: 60.5},
+        (2160, 1440): {30: 16,  60: 24},
+        (1920, 1080): {30: 8,   60: 12},
+        (1280, 720):  {30: 5,   60: 7.5},
+        (640, 480):   {30: 2.5, 60: 4},
+        (480, 360):   {30: 1,   60: 1.5}
+    }
+
+    if (width, height) in resolutions:
+        mbps = resolutions[(width, height)].get(fps)
+    else:
+        area = width * height
+        multiplier = 3.5982188179592543e-06 if fps == 30 else 5.396175171097084e-06
+        constant = 2.418399836285939 if fps == 30 else 3.742780056500365
+        mbps = multiplier * area + constant
+
+    return int(mbps * 1000 / 50) * 50
+
+
+@pytest.mark.parametrize("fps", [30, 60])
+@pytest.mark.parametrize("width, height", [
+    # table entries
+    (7680, 4320), (3840, 2160), (1920, 1080), (1280, 720), (640, 480), (480, 360),
+    # model estimates, including what common screens are scaled down to
+    (1000, 1000), (2560, 1080),
+    _scale_resolution(2560, 1600, 1280, 720),
+    _scale_resolution(3024 * 2, 1964 * 2, 1280, 720),
+])
+def test_bitrate_matches_the_old_mbps_expression(width, height, fps):
+    assert _get_bitrate_kbps_quantized(width, height, fps=fps) == _old_bitrate_kbps(width, height, fps)
+
+
+def test_bitrate_table_values():
+    assert _get_bitrate_kbps_quantized(1920, 1080, fps=30) == 8000
+    assert _get_bitrate_kbps_quantized(3840, 2160, fps=60) == 60500
+    assert _get_bitrate_kbps_quantized(1280, 720, fps=60) == 7500
+
+
+class _Socket:
+    def __init__(self, fail_on):
+        self.fail_on = fail_on
+        self.closed = False
+
+    def send(self, data):
+        if self.fail_on == "send":
+            raise ConnectionError("send failed")
+
+    def recv(self):
+        raise TimeoutError("no response")
+
+    def close(self):
+        self.closed = True
+
+
+class _ReqClient:
+    def __init__(self, ws=None):
+        self.base_client = SimpleNamespace(ws=ws)
+        self.parameters = []
+
+    def set_profile_parameter(self, category, name, value):
+        self.parameters.append((category, name, value))
+
+
+PARAMETERS = [("Video", "FPSInt", "30"), ("SimpleOutput", "VBitrate", "5000")]
+
+
+def _client_with_socket(ws) -> OBSClient:
+    client = OBSClient.__new__(OBSClient)
+    client.req_client = _ReqClient(ws)
+    return client
+
+
+def test_unsent_batch_falls_back_on_the_same_connection():
+    ws = _Socket(fail_on="send")
+    client = _client_with_socket(ws)
+    req_client = client.req_client
+
+    client._set_profile_parameters(PARAMETERS)
+
+    assert client.req_client is req_client
+    assert req_client.parameters == PARAMETERS
+    assert not ws.closed
+
+
+def test_sent_batch_without_a_response_falls_back_on_a_new_connection(monkeypatch):
+    monkeypatch.setattr(obs_client.obs, "ReqClient", _ReqClient)
+    ws = _Socket(fail_on="recv")
+    client = _client_with_socket(ws)
+    req_client = client.req_client
+
+    client._set_profile_parameters(PARAMETERS)
+
+    # the late batch response can't be taken for the reply to one of the single requests
+    assert ws.closed
+    assert client.req_client is not req_client
+    assert req_client.parameters == []
+    assert client.req_client.parameters == PARAMETERS
+
+
+def test_websocket_is_ready_once_its_port_accepts_connections(monkeypatch):
+    with socket.create_server(("localhost", 0)) as server:
+        monkeypatch.setattr(obs_client, "OBS_WEBSOCKET_PORT", server.getsockname()[1])
+        assert obs_client.is_obs_websocket_ready()
+
+    assert not obs_client.is_obs_websocket_ready()
@@ -0,0 +1,165 @@
+import json
+import os
+from collections import deque
+
+import pytest
+
+from ducktrack import recorder
+from ducktrack.recorder import PreciseTimer, Recorder, _write_all
+
+INTERVAL = Recorder.MOVE_COALESCE_INTERVAL
+
+
+class _Batcher:
+    """
+    Just the state Recorder's event batching works on, so it can be tested without starting a QThread.
+    """
+
+    MOVE_COALESCE_INTERVAL = Recorder.MOVE_COALESCE_INTERVAL
+    WRITE_BATCH_SIZE = Recorder.WRITE_BATCH_SIZE
+
+    _take_events = Recorder._take_events
+    _take_pending_move = Recorder._take_pending_move
+    _take_batch = Recorder._take_batch
+
+    def __init__(self, *events):
+        self.event_queue = deque(events)
+        self._last_move_ts = 0.0
+        self._pending_move = None
+        self.now = 0.0
+
+    def _perf_counter(self):
+        return self.now
+
+
+def _decode(batch: list[bytes]) -> list[tuple]:
+    return [(event["time_stamp"], event["action"]) for event in map(json.loads, batch)]
+
+
+def _move(ts: float) -> tuple:
+    return (ts, "move", 1, 2)
+
+
+def test_moves_further_apart_than_the_interval_are_all_written():
+    timestamps = [10.0, 10.0 + 1.5 * INTERVAL, 10.0 + 3 * INTERVAL]
+    batcher = _Batcher(*map(_move, timestamps))
+
+    assert _decode(batcher._take_events()) == [(ts, "move") for ts in timestamps]
+    assert batcher._pending_move is None
+
+
+def test_close_moves_are_collapsed_into_the_latest_one():
+    batcher = _Batcher(_move(10.0), _move(10.001), _move(10.002), _move(10.003))
+
+    assert _decode(batcher._take_events()) == [(10.0, "move")]
+    assert batcher._pending_move == _move(10.003)
+
+
+def test_held_back_move_is_written_before_the_next_event():
+    batcher = _Batcher(_move(10.0), _move(10.001), (10.002, "click", 1, 2, "left", True))
+
+    assert _decode(batcher._take_events()) == [(10.0, "move"), (10.001, "move"), (10.002, "click")]
+    assert batcher._pending_move is None
+
+
+def test_held_back_move_is_written_once_its_window_is_over():
+    batcher = _Batcher(_move(10.0), _move(10.001))
+    batcher.now = 10.0 + INTERVAL / 2
+
+    assert _decode(batcher._take_batch()) == [(10.0, "move")]
+    assert batcher._pending_move == _move(10.001)
+
+    batcher.now = 10.0 + 1.5 * INTERVAL
+    assert _decode(batcher._take_batch()) == [(10.001, "move")]
+    assert batcher._pending_move is None
+
+
+def test_flushed_move_counts_as_the_last_written_one():
+    held_back = 10.0 + 0.75 * INTERVAL
+    batcher = _Batcher(_move(10.0), _move(held_back))
+    batcher.now = 10.0 + 1.1 * INTERVAL
+    assert _decode(batcher._take_batch()) == [(10.0, "move"), (held_back, "move")]
+
+    # closer than the interval to the flushed move, though not to the first one
+    next_move = 10.0 + 1.25 * INTERVAL
+    batcher.event_queue.append(_move(next_move))
+    batcher.now = next_move
+
+    assert batcher._take_batch() == []
+    assert batcher._pending_move == _move(next_move)
+
+
+def test_take_events_stops_at_the_limit():
+    batcher = _Batcher(*[(10.0 + i, "press", "a") for i in range(5)])
+
+    assert len(batcher._take_events(3)) == 3
+    assert len(batcher.event_queue) == 2
+
+
+def _write_and_read_back(tmp_path, chunks: list[bytes]) -> bytes:
+    path = tmp_path / "events.jsonl"
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        _write_all(fd, chunks)
+    finally:
+        os.close(fd)
+    return path.read_bytes()
+
+
+def test_write_all_writes_every_chunk_in_order(tmp_path):
+    chunks = [b"%d\n" % i for i in range(recorder._IOV_MAX * 2 + 3)]
+
+    assert _write_and_read_back(tmp_path, chunks) == b"".join(chunks)
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="only platforms with writev gather the chunks")
+def test_write_all_finishes_a_short_writev(tmp_path, monkeypatch):
+    real_writev = os.writev
+
+    def short_writev(fd, buffers):
+        # only take part of the first buffer, like a write interrupted by a signal
+        return real_writev(fd, [buffers[0][:3]])
+
+    monkeypatch.setattr(os, "writev", short_writev)
+    chunks = [b"first line\n", b"second line\n", b"third\n"]
+
+    assert _write_and_read_back(tmp_path, chunks) == b"".join(chunks)
+
+
+class _Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_timer_ticks_on_fixed_deadlines(monkeypatch):
+    clock = _Clock(100.0)
+    monkeypatch.setattr(recorder.time, "monotonic", clock)
+    timer = PreciseTimer(2.0)
+
+    # work that ends a little after the deadline doesn't push the next one back
+    clock.now = 102.5
+    timer._advance()
+
+    assert timer.next_deadline == 104.0
+    assert timer.remaining() == 1.5
+
+
+def test_timer_skips_missed_ticks(monkeypatch):
+    clock = _Clock(100.0)
+    monkeypatch.setattr(recorder.time, "monotonic", clock)
+    timer = PreciseTimer(2.0)
+
+    clock.now = 107.0
+    timer._advance()
+
+    assert timer.next_deadline == 108.0
+
+
+def test_timer_wait_returns_false_once_cancelled():
+    timer = PreciseTimer(60.0)
+    timer.cancel()
+
+    assert timer.wait() is False